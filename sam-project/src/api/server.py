@@ -12,10 +12,17 @@ from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timezone
 import uvicorn
-import uuid
+import secrets
 import math
+import os
+import sys
+
+if not __package__:
+    # Run directly (python src/api/server.py): make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.timeutil import now_iso
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -133,32 +140,42 @@ class ResourceAllocationRequest(BaseModel):
 # HELPER FUNCTIONS
 # ============================================================
 
+# Severity keywords, built once at import instead of per report
+_CRITICAL_KEYWORDS = ('unconscious', 'not breathing', 'cardiac', 'severe bleeding', 'crushed', 'trapped', 'fire')
+_URGENT_KEYWORDS = ('bleeding', 'fracture', 'broken', 'head injury', 'chest pain', 'collapse')
+_SERIOUS_KEYWORDS = ('injured', 'pain', 'cut', 'sprain', 'stuck')
+_VULNERABLE_KEYWORDS = ('child', 'baby', 'elderly', 'pregnant')
+_HAZARD_KEYWORDS = ('fire', 'smoke', 'gas leak', 'flood')
+
+# Allocation order for equipment request priorities; unknown priorities go last
+_EQUIPMENT_PRIORITY_ORDER = {"required": 0, "recommended": 1, "optional": 2}
+
+# Priority level indexed by severity score 0-10
+_PRIORITY_LEVELS = (
+    "NON-URGENT", "NON-URGENT", "NON-URGENT", "MINOR", "MINOR",
+    "SERIOUS", "SERIOUS", "URGENT", "URGENT", "CRITICAL", "CRITICAL",
+)
+
+
 def analyze_severity(description: str) -> Dict[str, Any]:
     """Analyze description and return severity score."""
     lower_desc = description.lower()
     
-    critical = ['unconscious', 'not breathing', 'cardiac', 'severe bleeding', 'crushed', 'trapped', 'fire']
-    urgent = ['bleeding', 'fracture', 'broken', 'head injury', 'chest pain', 'collapse']
-    serious = ['injured', 'pain', 'cut', 'sprain', 'stuck']
-    
     score = 3
-    if any(kw in lower_desc for kw in critical):
+    if any(kw in lower_desc for kw in _CRITICAL_KEYWORDS):
         score = 9
-    elif any(kw in lower_desc for kw in urgent):
+    elif any(kw in lower_desc for kw in _URGENT_KEYWORDS):
         score = 7
-    elif any(kw in lower_desc for kw in serious):
+    elif any(kw in lower_desc for kw in _SERIOUS_KEYWORDS):
         score = 5
     
     # Modifiers
-    if any(word in lower_desc for word in ['child', 'baby', 'elderly', 'pregnant']):
+    if any(word in lower_desc for word in _VULNERABLE_KEYWORDS):
         score = min(10, score + 1)
-    if any(word in lower_desc for word in ['fire', 'smoke', 'gas leak', 'flood']):
+    if any(word in lower_desc for word in _HAZARD_KEYWORDS):
         score = min(10, score + 1)
     
-    levels = {10: "CRITICAL", 9: "CRITICAL", 8: "URGENT", 7: "URGENT", 
-              6: "SERIOUS", 5: "SERIOUS", 4: "MINOR", 3: "MINOR", 2: "NON-URGENT", 1: "NON-URGENT"}
-    
-    return {"score": score, "priority_level": levels.get(score, "MINOR")}
+    return {"score": score, "priority_level": _PRIORITY_LEVELS[score]}
 
 
 def calculate_eta(team_loc: Dict, victim_loc: Dict) -> int:
@@ -179,7 +196,7 @@ async def health_check():
     return {
         "status": "ok",
         "version": "1.0.0",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": now_iso(),
         "agents": [
             {"name": "OrchestratorAgent", "status": "active"},
             {"name": "SeverityAgent", "status": "active"},
@@ -203,7 +220,7 @@ async def submit_victim_report(request: VictimReportRequest):
         raise HTTPException(400, "Location description or coordinates required")
     
     # Generate victim ID
-    victim_id = f"V-{uuid.uuid4().hex[:8]}"
+    victim_id = f"V-{secrets.randbits(32):08x}"
     
     # Analyze severity
     severity = analyze_severity(request.description)
@@ -222,7 +239,7 @@ async def submit_victim_report(request: VictimReportRequest):
         "num_people": request.num_people,
         "status": "pending",
         "color_code": "red" if severity["score"] >= 9 else "orange" if severity["score"] >= 5 else "yellow",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": now_iso(),
     }
     
     # Add and sort queue
@@ -268,7 +285,7 @@ async def update_victim_status(request: VictimStatusUpdate):
     for victim in priority_queue:
         if victim["victim_id"] == request.victim_id:
             victim["status"] = request.status
-            victim["status_updated"] = datetime.now(timezone.utc).isoformat()
+            victim["status_updated"] = now_iso()
             return {
                 "status": "success",
                 "victim_id": request.victim_id,
@@ -406,12 +423,18 @@ async def get_inventory(item: Optional[str] = None):
 @app.post("/api/resource/allocate")
 async def allocate_resources(request: ResourceAllocationRequest):
     """Allocate resources to a mission."""
-    mission_id = request.mission_id or f"M-{uuid.uuid4().hex[:8]}"
+    mission_id = request.mission_id or f"M-{secrets.randbits(32):08x}"
     
     allocated = []
     shortfall = []
     
-    for item in request.equipment_list:
+    # Serve required items before recommended ones; the sort is stable, so ties keep request order
+    equipment_list = sorted(
+        request.equipment_list,
+        key=lambda e: _EQUIPMENT_PRIORITY_ORDER.get(e.get("priority"), len(_EQUIPMENT_PRIORITY_ORDER))
+    )
+    
+    for item in equipment_list:
         item_name = item.get("item") or item.get("name")
         quantity = item.get("quantity", 1)
         
@@ -4,6 +4,13 @@ Agent-to-Agent Communication Tools for Orchestrator
 from typing import Any, Dict, Optional
 from google.adk.tools import ToolContext
 from solace_ai_connector.common.log import log
+from .severity import classify_score
+
+# Static prefix for the SeverityAgent prompt; the description is appended per call
+_PROMPT_PREFIX = "Analyze this disaster situation: "
+
+# Score assumed when the SeverityAgent cannot be reached
+_FALLBACK_SCORE = 5
 
 
 async def call_severity_agent(
@@ -38,7 +45,7 @@ async def call_severity_agent(
         }
     
     try:
-        log.info(f"{log_identifier} Sending request to SeverityAgent for victim {victim_id}")
+        log.info("%s Sending request to SeverityAgent for victim %s", log_identifier, victim_id)
         
         # Get the host component which has the A2A communication capabilities
         host_component = getattr(tool_context._invocation_context, "agent", None)
@@ -46,7 +53,7 @@ async def call_severity_agent(
             host_component = getattr(host_component, "host_component", None)
         
         if not host_component:
-            log.error(f"{log_identifier} Could not access host component")
+            log.error("%s Could not access host component", log_identifier)
             return {
                 "status": "error",
                 "message": "Could not access agent host component"
@@ -55,7 +62,7 @@ async def call_severity_agent(
         # Get the A2A service from the host component
         a2a_service = getattr(host_component, "a2a_service", None)
         if not a2a_service:
-            log.error(f"{log_identifier} A2A service not available")
+            log.error("%s A2A service not available", log_identifier)
             return {
                 "status": "error",
                 "message": "A2A service not initialized"
@@ -70,38 +77,38 @@ async def call_severity_agent(
         if num_people is not None:
             request_payload["num_people"] = num_people
         
-        log.info(f"{log_identifier} Request payload: {request_payload}")
+        log.info("%s Request payload: %s", log_identifier, request_payload)
         
         # Send the request to SeverityAgent using A2A protocol
         # The target agent name must match exactly: "SeverityAgent"
         response = await a2a_service.send_agent_request(
             target_agent_name="SeverityAgent",
-            user_message=f"Analyze this disaster situation: {description}",
+            user_message=_PROMPT_PREFIX + description,
             session_id=f"severity_request_{victim_id}",
             timeout_seconds=30
         )
         
         if response and response.get("status") == "success":
-            log.info(f"{log_identifier} Received response from SeverityAgent")
+            log.info("%s Received response from SeverityAgent", log_identifier)
             return response
         else:
-            log.warning(f"{log_identifier} SeverityAgent returned no valid response")
+            log.warning("%s SeverityAgent returned no valid response", log_identifier)
             # Return a default score if the agent doesn't respond
             return {
                 "status": "fallback",
-                "score": 5,
-                "priority_level": "SERIOUS",
+                "score": _FALLBACK_SCORE,
+                "priority_level": classify_score(_FALLBACK_SCORE)[0],
                 "reasoning": "Default score - SeverityAgent did not respond",
                 "victim_id": victim_id
             }
         
     except Exception as e:
-        log.error(f"{log_identifier} Error calling SeverityAgent: {e}")
+        log.error("%s Error calling SeverityAgent: %s", log_identifier, e)
         # Return a default score on error
         return {
             "status": "error",
-            "score": 5,
-            "priority_level": "SERIOUS",
+            "score": _FALLBACK_SCORE,
+            "priority_level": classify_score(_FALLBACK_SCORE)[0],
             "reasoning": f"Error communicating with SeverityAgent: {str(e)}",
             "victim_id": victim_id
         }
\ No newline at end of file
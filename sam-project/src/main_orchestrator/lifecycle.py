@@ -6,11 +6,18 @@ Lifecycle functions run at specific points in the agent's lifetime:
 - cleanup: Run once when agent stops (cleanup resources)
 """
 
-from typing import Any
+import asyncio
+from typing import Any, Coroutine, Set
 from pydantic import BaseModel, Field
 from solace_ai_connector.common.log import log
 from .services.priority_queue_service import PriorityQueueService
 
+# Upper bound on how long shutdown waits for the final queue save
+FLUSH_TIMEOUT_SECONDS = 10
+
+# Flushes scheduled on an already-running loop, held so they are not garbage-collected
+_pending_flushes: Set[asyncio.Task] = set()
+
 
 class OrchestratorInitConfig(BaseModel):
     """
@@ -38,7 +45,7 @@ def initialize_orchestrator_agent(
         init_config: Validated configuration from YAML file
     """
     log_identifier = f"[{host_component.agent_name}:init]"
-    log.info(f"{log_identifier} Starting Orchestrator initialization...")
+    log.info("%s Starting Orchestrator initialization...", log_identifier)
     
     try:
         # Get artifact service from the agent's services
@@ -68,19 +75,60 @@ def initialize_orchestrator_agent(
         host_component.set_agent_specific_state("pending_requests", {})
         
         # Log startup message
-        log.info(f"{log_identifier} {init_config.startup_message}")
+        log.info("%s %s", log_identifier, init_config.startup_message)
         
         # Store initialization metadata
         host_component.set_agent_specific_state("initialized_at", "now")
         host_component.set_agent_specific_state("total_victims_processed", 0)
         
-        log.info(f"{log_identifier} Orchestrator initialization completed successfully")
+        log.info("%s Orchestrator initialization completed successfully", log_identifier)
         
     except Exception as e:
-        log.error(f"{log_identifier} Failed to initialize Orchestrator: {e}")
+        log.error("%s Failed to initialize Orchestrator: %s", log_identifier, e)
         raise
 
 
+def _run_to_completion(host_component: Any, coro: Coroutine) -> Any:
+    """
+    Run a coroutine from a synchronous lifecycle hook.
+    
+    Uses the agent's event loop when it is running on another thread,
+    otherwise runs the coroutine on a fresh loop. When the hook is called
+    on the agent's own loop, blocking would deadlock it, so the coroutine is
+    scheduled as a task on that loop (kept referenced until it finishes)
+    and the task is returned instead of its result.
+    """
+    get_loop = getattr(host_component, "get_async_loop", None)
+    loop = get_loop() if get_loop else None
+    
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    
+    if running is not None and (loop is None or loop is running or not loop.is_running()):
+        task = running.create_task(coro)
+        _pending_flushes.add(task)
+        task.add_done_callback(_pending_flushes.discard)
+        return task
+    
+    if loop is not None and loop.is_running():
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        return future.result(timeout=FLUSH_TIMEOUT_SECONDS)
+    
+    return asyncio.run(coro)
+
+
+async def _flush_queue(queue_service: PriorityQueueService, log_identifier: str) -> bool:
+    """Flush the priority queue and log whether the unsaved changes were persisted."""
+    if await queue_service.flush():
+        log.info("%s Priority queue service cleaned up", log_identifier)
+        return True
+    
+    log.error("%s Priority queue flush failed; unsaved victims were not persisted", log_identifier)
+    return False
+
+
 def cleanup_orchestrator_agent(host_component: Any):
     """
     Clean up Orchestrator Agent resources.
@@ -89,21 +137,23 @@ def cleanup_orchestrator_agent(host_component: Any):
         host_component: The agent host component
     """
     log_identifier = f"[{host_component.agent_name}:cleanup]"
-    log.info(f"{log_identifier} Starting Orchestrator cleanup...")
+    log.info("%s Starting Orchestrator cleanup...", log_identifier)
     
     try:
         # Get the queue service
         queue_service = host_component.get_agent_specific_state("queue_service")
         
         if queue_service:
-            # No async cleanup needed for artifact-based storage
-            log.info(f"{log_identifier} Priority queue service cleaned up")
+            # Persist any unsaved changes and release the in-memory queue
+            result = _run_to_completion(host_component, _flush_queue(queue_service, log_identifier))
+            if isinstance(result, asyncio.Task):
+                log.info("%s Priority queue flush scheduled on the agent loop", log_identifier)
         
         # Log final statistics
         total_processed = host_component.get_agent_specific_state("total_victims_processed", 0)
-        log.info(f"{log_identifier} Orchestrator processed {total_processed} victims during its lifetime")
+        log.info("%s Orchestrator processed %s victims during its lifetime", log_identifier, total_processed)
         
-        log.info(f"{log_identifier} Orchestrator cleanup completed successfully")
+        log.info("%s Orchestrator cleanup completed successfully", log_identifier)
         
     except Exception as e:
-        log.error(f"{log_identifier} Error during cleanup: {e}")
\ No newline at end of file
+        log.error("%s Error during cleanup: %s", log_identifier, e)
\ No newline at end of file
@@ -5,10 +5,36 @@ This service manages the persistent priority queue of disaster victims,
 storing it in SAM's artifact service for persistence across restarts.
 """
 
-import json
+import asyncio
+import bisect
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
+import orjson
 from solace_ai_connector.common.log import log
+from solace_agent_mesh.agent.utils.artifact_helpers import save_artifact_with_metadata
+from ..severity import classify_score
+from ...timeutil import now_iso
+
+# The journal is rewritten whole on every flush, so it is folded back into a fresh
+# snapshot once it outgrows the snapshot itself (but never below this floor)
+JOURNAL_COMPACT_BYTES = 4 * 1024
+JOURNAL_MIME_TYPE = "application/x-ndjson"
+SNAPSHOT_MIME_TYPE = "application/json"
+
+# How long the background flusher waits to coalesce a burst of mutations
+FLUSH_DELAY_SECONDS = 0.05
+# Back-off before retrying after a failed write
+FLUSH_RETRY_SECONDS = 5
+
+
+def _sort_key(entry: Dict[str, Any]) -> tuple:
+    """Queue order: higher score first, then earlier timestamp."""
+    return (-entry["score"], entry["timestamp"])
+
+
+def _as_bytearray(content) -> bytearray:
+    """Artifact content as a mutable byte buffer."""
+    return bytearray(content.encode('utf-8') if isinstance(content, str) else content)
 
 
 class PriorityQueueService:
@@ -31,82 +57,153 @@ class PriorityQueueService:
         self.app_name = app_name
         self.user_id = "system"  # System-level storage
         self.queue_filename = "disaster_priority_queue.json"
+        self.journal_filename = "disaster_priority_queue.log"
         self.queue_cache: List[Dict[str, Any]] = []
+        self._index: Dict[str, int] = {}  # victim_id -> position in queue_cache
+        self._keys: List[tuple] = []  # _sort_key of each queue_cache entry, kept in step
+        self._loaded = False  # Whether queue_cache reflects persistent storage
+        self._load_lock = asyncio.Lock()  # Serializes loads so concurrent first accesses share one
+        self._dirty = asyncio.Event()  # Set while queue_cache has changes not yet saved
+        self._flush_task: Optional[asyncio.Task] = None
+        self._journal = bytearray()  # JSON-lines mutation records since the last snapshot
+        self._snapshot_bytes = 0  # Size of the snapshot currently in storage
+        self._snapshot_unread = False  # Stored snapshot failed to load; writes wait until it is read
+        self._journal_unread = False  # Stored journal failed to load; writes wait until it is read
         self.log_identifier = "[PriorityQueueService]"
         
-        log.info(f"{self.log_identifier} Initialized with artifact service")
+        log.info("%s Initialized with artifact service", self.log_identifier)
     
     async def load_queue(self) -> List[Dict[str, Any]]:
         """
         Load the priority queue from persistent storage.
         
+        Reads the last snapshot and replays any journal records
+        written since then. If either artifact cannot be read the error
+        is logged and the queue carries on without it, marked degraded:
+        new changes are kept in memory and journaled, but nothing is
+        written until the unread artifact has been read again and merged
+        underneath them, so the stored queue is never overwritten.
+        
         Returns:
             List of victim entries, sorted by priority
         """
+        async with self._load_lock:
+            return await self._load()
+    
+    @property
+    def degraded(self) -> bool:
+        """True while a stored artifact could not be read and writes are held back."""
+        return self._snapshot_unread or self._journal_unread
+    
+    async def _ensure_loaded(self) -> None:
+        """Load the queue on first access; callers arriving mid-load wait for that load."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if not self._loaded:
+                await self._load()
+    
+    async def _load(self) -> List[Dict[str, Any]]:
+        """Read storage into the in-memory queue. Callers hold _load_lock."""
+        queue: List[Dict[str, Any]] = []
+        journal_bytes = bytearray()
+        snapshot_bytes = 0
+        
+        # Fetch the snapshot and journal in one round-trip; each may fail on its own
+        result, journal = await asyncio.gather(
+            self._load_artifact(self.queue_filename),
+            self._load_artifact(self.journal_filename),
+            return_exceptions=True
+        )
+        
+        snapshot_unread = False
         try:
-            # Attempt to load from artifact storage
-            result = await self.artifact_service.load_artifact(
-                app_name=self.app_name,
-                user_id=self.user_id,
-                filename=self.queue_filename
-            )
-            
+            if isinstance(result, BaseException):
+                raise result
             if result and result.get("content"):
-                queue_data = json.loads(result["content"])
-                self.queue_cache = queue_data
-                log.info(f"{self.log_identifier} Loaded {len(queue_data)} items from persistent storage")
-                return queue_data
-            else:
-                log.info(f"{self.log_identifier} No existing queue found, starting fresh")
-                self.queue_cache = []
-                return []
-                
+                queue = orjson.loads(result["content"])
+                snapshot_bytes = len(result["content"])
         except Exception as e:
-            log.warning(f"{self.log_identifier} Error loading queue: {e}, starting fresh")
-            self.queue_cache = []
-            return []
+            snapshot_unread = True
+            log.error("%s Error loading queue snapshot: %s, starting empty; writes held until it can be read",
+                     self.log_identifier, e)
+        
+        journal_unread = isinstance(journal, BaseException)
+        if journal_unread:
+            log.error("%s Error loading queue journal: %s, continuing without it; writes held until it can be read",
+                     self.log_identifier, journal)
+        elif journal and journal.get("content"):
+            # Replay mutations journaled after the snapshot
+            journal_bytes = _as_bytearray(journal["content"])
+            queue, replayed = self._replay_journal(queue, journal_bytes)
+            log.info("%s Replayed %s journal records", self.log_identifier, replayed)
+        
+        if queue:
+            log.info("%s Loaded %s items from persistent storage", self.log_identifier, len(queue))
+        else:
+            log.info("%s No existing queue found, starting fresh", self.log_identifier)
+        
+        # No awaits past this point, so no mutation can interleave with the swap
+        self.queue_cache = queue
+        self._journal = journal_bytes
+        self._snapshot_unread = snapshot_unread
+        self._journal_unread = journal_unread
+        self._snapshot_bytes = snapshot_bytes
+        self._dirty.clear()
+        self._keys = [_sort_key(entry) for entry in queue]
+        self._reindex()
+        self._loaded = True
+        return self.queue_cache
     
     async def save_queue(self) -> bool:
         """
-        Save the current priority queue to persistent storage.
+        Save a full snapshot of the priority queue to persistent storage.
+        
+        On success the journal records covered by the snapshot are dropped.
         
         Returns:
             True if save successful, False otherwise
         """
+        # A snapshot written now would drop whatever is in the unread artifacts
+        if not await self._recover_storage():
+            return False
+        
         try:
-            # Convert queue to JSON
-            content = json.dumps(self.queue_cache, indent=2, default=str)
+            content_bytes = orjson.dumps(self.queue_cache, default=str)
+            self._dirty.clear()
+            journal_covered = len(self._journal)
             
-            # Save using artifact service helper
-            from solace_agent_mesh.agent.utils.artifact_helpers import save_artifact_with_metadata
-            
-            result = await save_artifact_with_metadata(
-                artifact_service=self.artifact_service,
-                app_name=self.app_name,
-                user_id=self.user_id,
-                session_id=None,  # System-level, not session-specific
+            now = datetime.now(timezone.utc)
+            success = await self._save_artifact(
                 filename=self.queue_filename,
-                content_bytes=content.encode('utf-8'),
-                mime_type="application/json",
+                content_bytes=content_bytes,
+                mime_type=SNAPSHOT_MIME_TYPE,
                 metadata_dict={
                     "description": "Disaster response priority queue",
                     "queue_size": len(self.queue_cache),
-                    "last_updated": datetime.now(timezone.utc).isoformat(),
+                    "last_updated": now.isoformat(),
                     "top_score": self.queue_cache[0]["score"] if self.queue_cache else None
                 },
-                timestamp=datetime.now(timezone.utc)
+                timestamp=now
             )
             
-            success = result.get("status") == "success"
-            if success:
-                log.info(f"{self.log_identifier} Saved {len(self.queue_cache)} items to persistent storage")
-            else:
-                log.error(f"{self.log_identifier} Failed to save queue: {result.get('message')}")
+            if not success:
+                self._dirty.set()
+                return False
+            
+            self._snapshot_bytes = len(content_bytes)
+            log.info("%s Saved %s items to persistent storage", self.log_identifier, len(self.queue_cache))
             
-            return success
+            # Truncate the journal; keep records appended while the snapshot was being written
+            if journal_covered:
+                del self._journal[:journal_covered]
+                await self._write_journal()
+            
+            return True
             
         except Exception as e:
-            log.error(f"{self.log_identifier} Error saving queue: {e}")
+            self._dirty.set()
+            log.error("%s Error saving queue: %s", self.log_identifier, e)
             return False
     
     async def add_or_update_victim(
@@ -135,31 +232,13 @@ class PriorityQueueService:
             Dictionary with updated queue info
         """
         # Ensure queue is loaded
-        if not self.queue_cache:
-            await self.load_queue()
+        await self._ensure_loaded()
         
         # Check if victim already exists
-        existing_idx = next(
-            (i for i, v in enumerate(self.queue_cache) if v["victim_id"] == victim_id),
-            None
-        )
+        existing_idx = self._index.get(victim_id)
         
         # Determine priority level from score
-        if score >= 9:
-            priority_level = "CRITICAL"
-            color_code = "red"
-        elif score >= 7:
-            priority_level = "URGENT"
-            color_code = "orange"
-        elif score >= 5:
-            priority_level = "SERIOUS"
-            color_code = "orange"
-        elif score >= 3:
-            priority_level = "MINOR"
-            color_code = "yellow"
-        else:
-            priority_level = "NON-URGENT"
-            color_code = "green"
+        priority_level, color_code = classify_score(score)
         
         # Create queue entry
         queue_entry = {
@@ -171,25 +250,30 @@ class PriorityQueueService:
             "resources": resources,
             "hospital_needs": hospital_needs,
             "num_people": num_people,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": now_iso(),
             "color_code": color_code,
             "status": "pending"  # pending, in_progress, resolved
         }
         
         if existing_idx is not None:
-            # Update existing entry
-            self.queue_cache[existing_idx] = queue_entry
-            log.info(f"{self.log_identifier} Updated existing entry for victim {victim_id}")
+            # Update existing entry: drop the old version before re-inserting
+            del self.queue_cache[existing_idx]
+            del self._keys[existing_idx]
+            log.info("%s Updated existing entry for victim %s", self.log_identifier, victim_id)
         else:
-            # Add new entry
-            self.queue_cache.append(queue_entry)
-            log.info(f"{self.log_identifier} Added new entry for victim {victim_id}")
+            log.info("%s Added new entry for victim %s", self.log_identifier, victim_id)
         
-        # Sort queue: higher score first, then earlier timestamp
-        self.queue_cache.sort(key=lambda x: (-x["score"], x["timestamp"]))
+        # Binary-search the entry into place instead of re-sorting the whole queue
+        new_key = _sort_key(queue_entry)
+        insert_idx = bisect.bisect_right(self._keys, new_key)
+        self._keys.insert(insert_idx, new_key)
+        self.queue_cache.insert(insert_idx, queue_entry)
         
-        # Save to persistent storage
-        await self.save_queue()
+        # Only positions from the first shifted slot onwards change
+        self._reindex(insert_idx if existing_idx is None else min(insert_idx, existing_idx))
+        
+        # Journal just this change; the background flusher persists it
+        self._append_journal({"op": "upsert", "entry": queue_entry})
         
         return {
             "victim_id": victim_id,
@@ -209,8 +293,7 @@ class PriorityQueueService:
         Returns:
             Dictionary with victims list and total count
         """
-        if not self.queue_cache:
-            await self.load_queue()
+        await self._ensure_loaded()
         
         victims = self.queue_cache
         
@@ -242,8 +325,7 @@ class PriorityQueueService:
     
     async def get_queue_size(self) -> int:
         """Get the total number of victims in the queue."""
-        if not self.queue_cache:
-            await self.load_queue()
+        await self._ensure_loaded()
         
         return len(self.queue_cache)
     
@@ -258,27 +340,32 @@ class PriorityQueueService:
         Returns:
             Dictionary with update result
         """
-        if not self.queue_cache:
-            await self.load_queue()
-        
-        for entry in self.queue_cache:
-            if entry["victim_id"] == victim_id:
-                entry["status"] = status
-                entry["status_updated"] = datetime.now(timezone.utc).isoformat()
-                await self.save_queue()
-                log.info(f"{self.log_identifier} Updated victim {victim_id} status to {status}")
-                return {
-                    "success": True,
-                    "victim_id": victim_id,
-                    "new_status": status,
-                    "message": f"Status updated to {status}"
-                }
-        
-        log.warning(f"{self.log_identifier} Victim {victim_id} not found for status update")
+        await self._ensure_loaded()
+        
+        idx = self._index.get(victim_id)
+        if idx is None:
+            log.warning("%s Victim %s not found for status update", self.log_identifier, victim_id)
+            return {
+                "success": False,
+                "victim_id": victim_id,
+                "message": f"Victim {victim_id} not found"
+            }
+        
+        entry = self.queue_cache[idx]
+        entry["status"] = status
+        entry["status_updated"] = now_iso()
+        self._append_journal({
+            "op": "status",
+            "victim_id": victim_id,
+            "status": status,
+            "status_updated": entry["status_updated"]
+        })
+        log.info("%s Updated victim %s status to %s", self.log_identifier, victim_id, status)
         return {
-            "success": False,
+            "success": True,
             "victim_id": victim_id,
-            "message": f"Victim {victim_id} not found"
+            "new_status": status,
+            "message": f"Status updated to {status}"
         }
     
     async def remove_victim(self, victim_id: str) -> bool:
@@ -291,19 +378,19 @@ class PriorityQueueService:
         Returns:
             True if removed successfully
         """
-        if not self.queue_cache:
-            await self.load_queue()
+        await self._ensure_loaded()
         
-        original_size = len(self.queue_cache)
-        self.queue_cache = [v for v in self.queue_cache if v["victim_id"] != victim_id]
-        
-        if len(self.queue_cache) < original_size:
-            await self.save_queue()
-            log.info(f"{self.log_identifier} Removed victim {victim_id} from queue")
-            return True
-        else:
-            log.warning(f"{self.log_identifier} Victim {victim_id} not found for removal")
+        idx = self._index.pop(victim_id, None)
+        if idx is None:
+            log.warning("%s Victim %s not found for removal", self.log_identifier, victim_id)
             return False
+        
+        del self.queue_cache[idx]
+        del self._keys[idx]
+        self._reindex(idx)
+        self._append_journal({"op": "remove", "victim_id": victim_id})
+        log.info("%s Removed victim %s from queue", self.log_identifier, victim_id)
+        return True
     
     async def get_victim_by_id(self, victim_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -315,29 +402,253 @@ class PriorityQueueService:
         Returns:
             Victim entry or None if not found
         """
-        if not self.queue_cache:
-            await self.load_queue()
+        await self._ensure_loaded()
+        
+        idx = self._index.get(victim_id)
+        return self.queue_cache[idx] if idx is not None else None
+    
+    async def flush(self) -> bool:
+        """
+        Save any unsaved changes and release the in-memory queue.
         
-        for entry in self.queue_cache:
-            if entry["victim_id"] == victim_id:
-                return entry
+        Stops the background flusher and persists whatever it had pending.
+        Called on agent shutdown; the next access reloads from storage.
+        If the save fails the in-memory queue is kept, so nothing is lost
+        and a later flush can retry.
         
-        return None
+        Returns:
+            True if the queue is persisted (or had nothing to save)
+        """
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            task_loop = task.get_loop()
+            if task_loop is asyncio.get_running_loop():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+            elif not task_loop.is_closed():
+                # Flushing from a fresh loop at shutdown; the flusher's loop owns the task
+                task_loop.call_soon_threadsafe(task.cancel)
+        
+        success = await self._persist() if self._dirty.is_set() else True
+        if not success:
+            log.error("%s Failed to persist priority queue on flush, keeping %s items in memory",
+                     self.log_identifier, len(self.queue_cache))
+            return False
+        
+        self.queue_cache = []
+        self._index = {}
+        self._keys = []
+        self._loaded = False
+        
+        log.info("%s Flushed priority queue", self.log_identifier)
+        return True
     
-    def _get_color_code(self, score: int) -> str:
-        """Get color code based on severity score."""
-        if score >= 9:
-            return "red"
-        elif score >= 7:
-            return "orange"
-        elif score >= 5:
-            return "orange"
-        else:
-            return "yellow"
+    async def _load_artifact(self, filename: str) -> Optional[Dict[str, Any]]:
+        """Read one artifact from the system-level store."""
+        return await self.artifact_service.load_artifact(
+            app_name=self.app_name,
+            user_id=self.user_id,
+            filename=filename
+        )
+    
+    async def _save_artifact(
+        self,
+        filename: str,
+        content_bytes: bytes,
+        mime_type: str,
+        metadata_dict: Dict[str, Any],
+        timestamp: Optional[datetime] = None
+    ) -> bool:
+        """
+        Write one artifact through SAM's artifact helper.
+        
+        Args:
+            timestamp: Save time to record; defaults to now
+            
+        Returns:
+            True if the artifact service reported success
+        """
+        try:
+            result = await save_artifact_with_metadata(
+                artifact_service=self.artifact_service,
+                app_name=self.app_name,
+                user_id=self.user_id,
+                session_id=None,  # System-level, not session-specific
+                filename=filename,
+                content_bytes=content_bytes,
+                mime_type=mime_type,
+                metadata_dict=metadata_dict,
+                timestamp=timestamp or datetime.now(timezone.utc)
+            )
+        except Exception as e:
+            log.error("%s Error saving %s: %s", self.log_identifier, filename, e)
+            return False
+        
+        if result.get("status") != "success":
+            log.error("%s Failed to save %s: %s", self.log_identifier, filename, result.get('message'))
+            return False
+        
+        return True
+    
+    async def _write_journal(self) -> bool:
+        """Persist the current journal buffer."""
+        if not await self._recover_storage():
+            return False
+        
+        return await self._save_artifact(
+            filename=self.journal_filename,
+            content_bytes=bytes(self._journal),
+            mime_type=JOURNAL_MIME_TYPE,
+            metadata_dict={
+                "description": "Disaster response priority queue journal",
+                "journal_bytes": len(self._journal)
+            }
+        )
+    
+    async def _recover_storage(self) -> bool:
+        """
+        Read stored artifacts that failed to load and merge them under the in-memory changes.
+        
+        Stored data is older than anything journaled since the load, so the
+        snapshot and stored journal are applied first and the newer records
+        replayed again on top.
+        
+        Returns:
+            True if nothing is left unread, False if an artifact still cannot be read
+        """
+        if not self.degraded:
+            return True
+        
+        snapshot_unread, journal_unread = self._snapshot_unread, self._journal_unread
+        try:
+            snapshot = await self._load_artifact(self.queue_filename) if snapshot_unread else None
+            journal = await self._load_artifact(self.journal_filename) if journal_unread else None
+            queue = orjson.loads(snapshot["content"]) if snapshot and snapshot.get("content") else []
+        except Exception as e:
+            log.error("%s Stored queue still unreadable: %s, not writing", self.log_identifier, e)
+            return False
+        
+        # Another caller may have recovered while this one was reading
+        if (snapshot_unread, journal_unread) != (self._snapshot_unread, self._journal_unread):
+            return not self.degraded
+        
+        base = queue if snapshot_unread else self.queue_cache
+        if journal and journal.get("content"):
+            stored = _as_bytearray(journal["content"])
+            base, _ = self._replay_journal(base, stored)
+            self._journal[:0] = stored
+        queue, _ = self._replay_journal(base, self._journal)
+        
+        self.queue_cache = queue
+        self._keys = [_sort_key(entry) for entry in queue]
+        self._reindex()
+        if snapshot_unread:
+            self._snapshot_bytes = len(snapshot["content"]) if snapshot and snapshot.get("content") else 0
+        self._snapshot_unread = self._journal_unread = False
+        log.info("%s Recovered stored queue after a failed load, %s items", self.log_identifier, len(queue))
+        return True
+    
+    def _append_journal(self, record: Dict[str, Any]) -> None:
+        """
+        Append one mutation record to the journal and schedule a flush.
+        
+        Args:
+            record: Mutation record ({"op": "upsert" | "status" | "remove", ...})
+        """
+        self._journal += orjson.dumps(record, default=str) + b"\n"
+        self._dirty.set()
+        
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flusher())
+    
+    async def _flusher(self) -> None:
+        """Background task that persists each burst of mutations with one write."""
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(FLUSH_DELAY_SECONDS)
+            
+            self._dirty.clear()
+            success = False
+            try:
+                success = await self._persist()
+            finally:
+                if not success:
+                    self._dirty.set()
+            
+            if not success:
+                await asyncio.sleep(FLUSH_RETRY_SECONDS)
+    
+    async def _persist(self) -> bool:
+        """
+        Persist pending changes.
+        
+        The artifact service has no append mode, so the journal artifact is
+        rewritten with the records since the last snapshot. Once that would be
+        larger than the stored snapshot (or JOURNAL_COMPACT_BYTES, whichever is
+        bigger) the journal is folded into a fresh snapshot instead, so a flush
+        never writes more than a full save would.
+        
+        Returns:
+            True if the changes were persisted
+        """
+        if len(self._journal) > max(JOURNAL_COMPACT_BYTES, self._snapshot_bytes):
+            log.info("%s Compacting %s journal bytes into snapshot", self.log_identifier, len(self._journal))
+            return await self.save_queue()
+        
+        return await self._write_journal()
+    
+    def _replay_journal(self, queue: List[Dict[str, Any]], journal: bytes) -> tuple:
+        """
+        Apply journal records on top of a loaded snapshot.
+        
+        Records carry the resulting state rather than deltas, so replaying
+        records already covered by the snapshot is harmless.
+        
+        Returns:
+            Tuple of (resulting sorted queue, number of records applied)
+        """
+        entries = {entry["victim_id"]: entry for entry in queue}
+        applied = 0
+        
+        for line in journal.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+            except ValueError:
+                log.warning("%s Skipping unreadable journal record", self.log_identifier)
+                continue
+            
+            op = record.get("op")
+            if op == "upsert":
+                entries[record["entry"]["victim_id"]] = record["entry"]
+            elif op == "status":
+                entry = entries.get(record["victim_id"])
+                if entry is not None:
+                    entry["status"] = record["status"]
+                    entry["status_updated"] = record["status_updated"]
+            elif op == "remove":
+                entries.pop(record["victim_id"], None)
+            applied += 1
+        
+        return sorted(entries.values(), key=_sort_key), applied
+    
+    def _reindex(self, start: int = 0) -> None:
+        """
+        Refresh the victim_id -> position index from `start` to the end of the queue.
+        
+        A start of 0 rebuilds the index, dropping ids no longer in the queue.
+        """
+        if start == 0:
+            self._index = {}
+        
+        index = self._index
+        for i in range(start, len(self.queue_cache)):
+            index[self.queue_cache[i]["victim_id"]] = i
     
     def _get_position(self, victim_id: str) -> int:
-        """Get the position of a victim in the queue (1-indexed)."""
-        for i, entry in enumerate(self.queue_cache):
-            if entry["victim_id"] == victim_id:
-                return i + 1
-        return -1
\ No newline at end of file
+        """Get the position of a victim in the queue (1-indexed), or -1 if absent."""
+        return self._index.get(victim_id, -2) + 1
\ No newline at end of file
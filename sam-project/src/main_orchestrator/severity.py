@@ -0,0 +1,36 @@
+"""
+Severity classification shared by the orchestrator's tools and priority queue.
+
+Maps a 1-10 severity score to its priority level and dashboard color code,
+so the SeverityAgent fallback and the queue agree on the same bands.
+"""
+
+from typing import Tuple
+
+# (priority_level, color_code) indexed by severity score 0-10
+_LEVELS: Tuple[Tuple[str, str], ...] = (
+    ("NON-URGENT", "green"),   # 0
+    ("NON-URGENT", "green"),   # 1
+    ("NON-URGENT", "green"),   # 2
+    ("MINOR", "yellow"),       # 3
+    ("MINOR", "yellow"),       # 4
+    ("SERIOUS", "orange"),     # 5
+    ("SERIOUS", "orange"),     # 6
+    ("URGENT", "orange"),      # 7
+    ("URGENT", "orange"),      # 8
+    ("CRITICAL", "red"),       # 9
+    ("CRITICAL", "red"),       # 10
+)
+
+
+def classify_score(score: int) -> Tuple[str, str]:
+    """
+    Classify a severity score into its priority level and color code.
+
+    Args:
+        score: Severity score (1-10); out-of-range values are clamped
+
+    Returns:
+        Tuple of (priority_level, color_code)
+    """
+    return _LEVELS[max(0, min(10, int(score)))]
@@ -8,7 +8,28 @@ severity/resources/hospital agents, and manages the priority queue.
 from typing import Any, Dict, Optional  # <-- Make sure this line is present!
 from google.adk.tools import ToolContext
 from solace_ai_connector.common.log import log
-import uuid
+import secrets
+from ..report_intake import freeze, get_host_component, incomplete_report, thaw
+
+_VALID_VICTIM_STATUSES = frozenset({"pending", "in_progress", "resolved"})
+_VALID_VICTIM_STATUSES_MSG = "pending, in_progress, resolved"
+
+# Placeholder resource needs by severity; frozen, and copied into each queue entry
+_RESOURCES_HIGH_SEVERITY = freeze({
+    "food": {"priority": "MEDIUM"},
+    "water": {"priority": "HIGH"},
+    "medical_supplies": {"priority": "HIGH"}
+})
+_RESOURCES_LOW_SEVERITY = freeze({
+    "food": {"priority": "MEDIUM"},
+    "water": {"priority": "HIGH"},
+    "medical_supplies": {"priority": "MEDIUM"}
+})
+
+# Placeholder hospital needs by severity; frozen, and copied into each queue entry
+_HOSPITAL_CRITICAL = freeze({"bed_type": "ICU", "urgency": "IMMEDIATE"})
+_HOSPITAL_STANDARD = freeze({"bed_type": "GENERAL", "urgency": "STANDARD"})
+
 
 async def process_validated_report(
     location: str,
@@ -45,25 +66,18 @@ async def process_validated_report(
     log_identifier = "[ProcessReport]"
     
     if not tool_context:
+        log.error("%s No tool context for report at (%s, %s)", log_identifier, latitude, longitude)
         return {"status": "error", "message": "Tool context required"}
     
     try:
         # Generate unique victim ID
-        victim_id = f"victim_{uuid.uuid4().hex[:8]}"
-        
-        log.info(f"{log_identifier} Processing report for {victim_id} with severity {severity_score}/10")
-        
-        # Get host component
-        host_component = getattr(tool_context._invocation_context, "agent", None)
-        if host_component:
-            host_component = getattr(host_component, "host_component", None)
+        victim_id = f"victim_{secrets.randbits(32):08x}"
         
+        host_component = get_host_component(tool_context)
         if not host_component:
+            log.error("%s No host component for report at (%s, %s)", log_identifier, latitude, longitude)
             return {"status": "error", "message": "Could not access agent host component"}
         
-        # Log immediate location
-        log.info(f"{log_identifier} [IMMEDIATE] Location: {latitude}, {longitude}")
-        
         # Use the severity score from SeverityAgent (not a placeholder!)
         severity_result = {
             "score": severity_score,
@@ -73,22 +87,16 @@ async def process_validated_report(
         
         # Resources (placeholder for now)
         resources_result = {
-            "resources": {
-                "food": {"priority": "MEDIUM"},
-                "water": {"priority": "HIGH"},
-                "medical_supplies": {"priority": "HIGH" if severity_score >= 7 else "MEDIUM"}
-            }
+            "resources": thaw(_RESOURCES_HIGH_SEVERITY if severity_score >= 7 else _RESOURCES_LOW_SEVERITY)
         }
         
         # Hospital needs (placeholder)
-        hospital_result = {
-            "bed_type": "ICU" if severity_score >= 9 else "GENERAL",
-            "urgency": "IMMEDIATE" if severity_score >= 9 else "STANDARD"
-        }
+        hospital_result = thaw(_HOSPITAL_CRITICAL if severity_score >= 9 else _HOSPITAL_STANDARD)
         
         # Update priority queue
         queue_service = host_component.get_agent_specific_state("queue_service")
         if not queue_service:
+            log.error("%s Queue service not initialized for report at (%s, %s)", log_identifier, latitude, longitude)
             return {"status": "error", "message": "Priority queue service not initialized"}
         
         queue_result = await queue_service.add_or_update_victim(
@@ -105,7 +113,11 @@ async def process_validated_report(
         total = host_component.get_agent_specific_state("total_victims_processed", 0)
         host_component.set_agent_specific_state("total_victims_processed", total + 1)
         
-        log.info(f"{log_identifier} Successfully processed {victim_id}, queue position: {queue_result['position']}")
+        # One line per report; every error path logs the location too
+        log.info(
+            "%s Processed %s: severity %s/10, location (%s, %s), queue position %s",
+            log_identifier, victim_id, severity_score, latitude, longitude, queue_result["position"]
+        )
         
         return {
             "status": "success",
@@ -118,7 +130,7 @@ async def process_validated_report(
         }
         
     except Exception as e:
-        log.error(f"{log_identifier} Error processing report: {e}")
+        log.error("%s Error processing report at (%s, %s): %s", log_identifier, latitude, longitude, e)
         return {
             "status": "error",
             "message": f"Failed to process report: {str(e)}"
@@ -154,54 +166,37 @@ async def validate_victim_report(
     """
     log_identifier = "[ValidateReport]"
     
-    missing_fields = []
-    next_question = None
-    
-    # Check location
-    has_coordinates = latitude is not None and longitude is not None
-    has_location_desc = location is not None and len(str(location).strip()) > 0
+    has_location = (
+        (latitude is not None and longitude is not None)
+        or (location is not None and bool(str(location).strip()))
+    )
+    has_description = bool(description) and len(str(description).strip()) >= 5
+    has_num_people = num_people is not None and num_people >= 1
     
-    if not has_coordinates and not has_location_desc:
-        missing_fields.append("location")
-        next_question = "What is your exact location? Please provide either an address/landmark or GPS coordinates."
+    # The missing-field list is only built for incomplete reports
+    if not (has_location and has_description and has_num_people):
+        missing_fields = [
+            field for field, present in (
+                ("location", has_location),
+                ("description", has_description),
+                ("num_people", has_num_people),
+            ) if not present
+        ]
+        return incomplete_report(log_identifier, missing_fields)
     
-    # Check description
-    if not description or len(str(description).strip()) < 5:
-        missing_fields.append("description")
-        if next_question is None:
-            next_question = "Can you describe what happened? Please include details about any injuries, hazards, or urgent conditions."
-    
-    # Check number of people
-    if num_people is None or num_people < 1:
-        missing_fields.append("num_people")
-        if next_question is None:
-            next_question = "How many people need assistance?"
-    
-    is_valid = len(missing_fields) == 0
-    
-    if is_valid:
-        log.info(f"{log_identifier} Report validation successful - all required fields present")
-        return {
-            "status": "success",
-            "is_valid": True,
-            "message": "All required information collected",
-            "data": {
-                "location": location,
-                "latitude": latitude,
-                "longitude": longitude,
-                "description": description,
-                "num_people": num_people
-            }
-        }
-    else:
-        log.info(f"{log_identifier} Report incomplete - missing: {', '.join(missing_fields)}")
-        return {
-            "status": "incomplete",
-            "is_valid": False,
-            "missing_fields": missing_fields,
-            "next_question": next_question,
-            "message": f"Missing required information: {', '.join(missing_fields)}"
+    log.info("%s Report validation successful - all required fields present", log_identifier)
+    return {
+        "status": "success",
+        "is_valid": True,
+        "message": "All required information collected",
+        "data": {
+            "location": location,
+            "latitude": latitude,
+            "longitude": longitude,
+            "description": description,
+            "num_people": num_people
         }
+    }
 async def get_priority_queue(
     limit: Optional[int] = 10,
     tool_context: Optional[ToolContext] = None,
@@ -224,11 +219,7 @@ async def get_priority_queue(
         return {"status": "error", "message": "Tool context required"}
     
     try:
-        # Get host component
-        host_component = getattr(tool_context._invocation_context, "agent", None)
-        if host_component:
-            host_component = getattr(host_component, "host_component", None)
-        
+        host_component = get_host_component(tool_context)
         if not host_component:
             return {"status": "error", "message": "Could not access agent host component"}
         
@@ -240,7 +231,7 @@ async def get_priority_queue(
         # Get queue
         queue_result = await queue_service.get_priority_queue(limit=limit)
         
-        log.info(f"{log_identifier} Retrieved {len(queue_result.get('victims', []))} victims from queue")
+        log.info("%s Retrieved %s victims from queue", log_identifier, len(queue_result.get("victims", [])))
         
         return {
             "status": "success",
@@ -250,7 +241,7 @@ async def get_priority_queue(
         }
         
     except Exception as e:
-        log.error(f"{log_identifier} Error getting priority queue: {e}")
+        log.error("%s Error getting priority queue: %s", log_identifier, e)
         return {
             "status": "error",
             "message": f"Failed to get priority queue: {str(e)}"
@@ -280,19 +271,14 @@ async def update_victim_status(
     if not tool_context:
         return {"status": "error", "message": "Tool context required"}
     
-    valid_statuses = ["pending", "in_progress", "resolved"]
-    if status not in valid_statuses:
+    if status not in _VALID_VICTIM_STATUSES:
         return {
             "status": "error",
-            "message": f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
+            "message": f"Invalid status '{status}'. Must be one of: {_VALID_VICTIM_STATUSES_MSG}"
         }
     
     try:
-        # Get host component
-        host_component = getattr(tool_context._invocation_context, "agent", None)
-        if host_component:
-            host_component = getattr(host_component, "host_component", None)
-        
+        host_component = get_host_component(tool_context)
         if not host_component:
             return {"status": "error", "message": "Could not access agent host component"}
         
@@ -305,7 +291,7 @@ async def update_victim_status(
         update_result = await queue_service.update_victim_status(victim_id, status)
         
         if update_result.get("success"):
-            log.info(f"{log_identifier} Updated {victim_id} status to '{status}'")
+            log.info("%s Updated %s status to '%s'", log_identifier, victim_id, status)
             return {
                 "status": "success",
                 "victim_id": victim_id,
@@ -320,7 +306,7 @@ async def update_victim_status(
             }
         
     except Exception as e:
-        log.error(f"{log_identifier} Error updating victim status: {e}")
+        log.error("%s Error updating victim status: %s", log_identifier, e)
         return {
             "status": "error",
             "message": f"Failed to update status: {str(e)}"
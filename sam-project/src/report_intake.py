@@ -0,0 +1,58 @@
+"""
+Report intake helpers shared by the orchestrator and resource agent tools.
+
+Both agents accept victim reports through the same tool surface, so host
+lookup, incomplete-report responses and placeholder templates live here
+rather than in each tools module. Placeholder templates are frozen so
+that one caller cannot change them for every victim; each queue entry
+gets its own plain copy.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+from google.adk.tools import ToolContext
+from solace_ai_connector.common.log import log
+
+# Follow-up question for each required report field, asked in this order
+MISSING_FIELD_QUESTIONS = MappingProxyType({
+    "location": "What is your exact location? Please provide either an address/landmark or GPS coordinates.",
+    "description": "Can you describe what happened? Please include details about any injuries, hazards, or urgent conditions.",
+    "num_people": "How many people need assistance?",
+})
+
+
+def get_host_component(tool_context: ToolContext) -> Optional[Any]:
+    """Resolve the agent host component behind a tool invocation, or None."""
+    agent = getattr(tool_context._invocation_context, "agent", None)
+    return getattr(agent, "host_component", None) if agent else None
+
+
+def incomplete_report(log_identifier: str, missing_fields: List[str]) -> Dict[str, Any]:
+    """Build the validation response for a report missing required fields; asks about the first."""
+    missing = ", ".join(missing_fields)
+    log.info("%s Report incomplete - missing: %s", log_identifier, missing)
+    return {
+        "status": "incomplete",
+        "is_valid": False,
+        "missing_fields": missing_fields,
+        "next_question": MISSING_FIELD_QUESTIONS[missing_fields[0]],
+        "message": f"Missing required information: {missing}"
+    }
+
+
+def freeze(value: Any) -> Any:
+    """Deep read-only view of a template: dicts become mapping proxies, lists tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain, independently mutable copy of a frozen template, safe to serialize."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
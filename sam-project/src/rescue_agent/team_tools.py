@@ -6,11 +6,17 @@ including location updates, assignments, and status tracking.
 """
 
 from typing import Any, Dict, Optional, List
-from datetime import datetime, timezone
+from collections import defaultdict
+from operator import itemgetter
 from google.adk.tools import ToolContext
 from solace_ai_connector.common.log import log
+from ..timeutil import now_iso
+import heapq
 import math
 
+_VALID_TEAM_STATUSES = frozenset({"available", "en_route", "on_scene", "returning"})
+_VALID_TEAM_STATUSES_MSG = "available, en_route, on_scene, returning"
+
 # In-memory team storage (use database in production)
 _teams: Dict[str, Dict[str, Any]] = {
     "T-Alpha": {
@@ -22,7 +28,7 @@ _teams: Dict[str, Dict[str, Any]] = {
         "location": {"lat": 13.7400, "lng": 100.5200},
         "assigned_to": None,
         "eta_minutes": None,
-        "last_update": datetime.now(timezone.utc).isoformat(),
+        "last_update": now_iso(),
         "equipment": ["hydraulic_cutter", "airbag_lifter", "stretcher", "first_aid_kit"],
     },
     "T-Bravo": {
@@ -34,7 +40,7 @@ _teams: Dict[str, Dict[str, Any]] = {
         "location": {"lat": 13.7350, "lng": 100.5150},
         "assigned_to": None,
         "eta_minutes": None,
-        "last_update": datetime.now(timezone.utc).isoformat(),
+        "last_update": now_iso(),
         "equipment": ["defibrillator", "oxygen_tank", "stretcher", "first_aid_kit", "iv_kit"],
     },
     "T-Charlie": {
@@ -46,7 +52,7 @@ _teams: Dict[str, Dict[str, Any]] = {
         "location": {"lat": 13.7450, "lng": 100.5250},
         "assigned_to": None,
         "eta_minutes": None,
-        "last_update": datetime.now(timezone.utc).isoformat(),
+        "last_update": now_iso(),
         "equipment": ["life_vest", "rescue_boat", "rope", "thermal_blanket", "first_aid_kit"],
     },
     "T-Delta": {
@@ -58,25 +64,129 @@ _teams: Dict[str, Dict[str, Any]] = {
         "location": {"lat": 13.7500, "lng": 100.5100},
         "assigned_to": None,
         "eta_minutes": None,
-        "last_update": datetime.now(timezone.utc).isoformat(),
+        "last_update": now_iso(),
         "equipment": ["fire_extinguisher", "breathing_apparatus", "thermal_camera", "hose"],
     },
 }
 
 
-def _calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """Calculate distance between two coordinates in kilometers using Haversine formula."""
-    R = 6371  # Earth's radius in kilometers
+# Teams indexed by status (status -> {team_id: team}), kept in step with _teams by _set_status
+_teams_by_status: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+for _team in _teams.values():
+    _teams_by_status[_team["status"]][_team["team_id"]] = _team
+del _team
+
+# Position of each team in _teams, so index lookups can return teams in roster order
+_team_order: Dict[str, int] = {team_id: i for i, team_id in enumerate(_teams)}
+
+# Team positions in radians as (lat_rad, lng_rad, cos_lat), refreshed on location updates
+_team_coords: Dict[str, tuple] = {}
+
+# One bit per equipment item carried by any team
+_EQUIPMENT_BITS: Dict[str, int] = {
+    name: 1 << i
+    for i, name in enumerate(sorted({eq for team in _teams.values() for eq in team["equipment"]}))
+}
+
+EARTH_RADIUS_KM = 6371
+# Below this separation in radians (~60 km) the flat-earth approximation is within 0.1%
+SHORT_RANGE_RAD = 0.01
+
+
+def _store_coords(team_id: str) -> None:
+    """Precompute the radians and latitude cosine of a team's current location."""
+    location = _teams[team_id]["location"]
+    lat_rad = math.radians(location["lat"])
+    _team_coords[team_id] = (lat_rad, math.radians(location["lng"]), math.cos(lat_rad))
+
+
+for _team_id in _teams:
+    _store_coords(_team_id)
+del _team_id
+
+
+def _equipment_mask(equipment: List[str]) -> Optional[int]:
+    """Bitmask for a list of equipment items, or None if any item is carried by no team."""
+    mask = 0
+    for item in equipment:
+        bit = _EQUIPMENT_BITS.get(item)
+        if bit is None:
+            return None
+        mask |= bit
+    return mask
+
+
+# Bitmask of the equipment each team carries
+_team_equipment: Dict[str, int] = {
+    team_id: _equipment_mask(team["equipment"]) for team_id, team in _teams.items()
+}
+
+
+def _set_status(team_id: str, status: str) -> None:
+    """Change a team's status and move it to the matching status index."""
+    team = _teams[team_id]
+    del _teams_by_status[team["status"]][team_id]
+    _teams_by_status[status][team_id] = team
+    team["status"] = status
+
+
+def _teams_with_status(status: str) -> List[Dict[str, Any]]:
+    """Teams currently in the given status, in _teams order."""
+    members = _teams_by_status.get(status)
+    if not members:
+        return []
+    return sorted(members.values(), key=lambda team: _team_order[team["team_id"]])
+
+
+def _count_status(status: str) -> int:
+    """Number of teams currently in the given status."""
+    return len(_teams_by_status.get(status, ()))
+
+
+def _distance_rad(lat1: float, lng1: float, cos_lat1: float,
+                  lat2: float, lng2: float, cos_lat2: float) -> float:
+    """
+    Distance in kilometers between two points given in radians with their latitude cosines.
+    
+    Uses the equirectangular approximation for short (in-city) ranges, with
+    the mean of the two cosines standing in for the cosine of the mean
+    latitude, and the Haversine formula otherwise.
+    """
+    delta_lat = lat2 - lat1
+    delta_lng = lng2 - lng1
+    
+    if abs(delta_lat) < SHORT_RANGE_RAD and abs(delta_lng) < SHORT_RANGE_RAD:
+        return EARTH_RADIUS_KM * math.hypot(delta_lng * (cos_lat1 + cos_lat2) / 2, delta_lat)
     
+    a = math.sin(delta_lat / 2) ** 2 + cos_lat1 * cos_lat2 * math.sin(delta_lng / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def _calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Calculate distance between two coordinates in kilometers."""
     lat1_rad = math.radians(lat1)
     lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lng = math.radians(lng2 - lng1)
-    
-    a = math.sin(delta_lat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lng/2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    return _distance_rad(
+        lat1_rad, math.radians(lng1), math.cos(lat1_rad),
+        lat2_rad, math.radians(lng2), math.cos(lat2_rad)
+    )
+
+
+def _distances_to(lat: float, lng: float, teams: List[Dict[str, Any]]) -> List[float]:
+    """
+    Distance in kilometers from one point to each team, in one pass.
     
-    return R * c
+    The point's radians and cosine are computed once; team positions come
+    precomputed from _team_coords.
+    """
+    lat_rad = math.radians(lat)
+    lng_rad = math.radians(lng)
+    cos_lat = math.cos(lat_rad)
+    
+    return [
+        _distance_rad(lat_rad, lng_rad, cos_lat, *_team_coords[team["team_id"]])
+        for team in teams
+    ]
 
 
 def _estimate_eta(distance_km: float, status: str = "en_route") -> int:
@@ -109,15 +219,15 @@ async def get_all_teams(
     """
     log_identifier = "[GetAllTeams]"
     
-    teams = list(_teams.values())
-    
     if status_filter:
-        teams = [t for t in teams if t["status"] == status_filter]
+        teams = _teams_with_status(status_filter)
+    else:
+        teams = list(_teams.values())
     
-    available_count = len([t for t in _teams.values() if t["status"] == "available"])
-    deployed_count = len([t for t in _teams.values() if t["status"] != "available"])
+    available_count = _count_status("available")
+    deployed_count = len(_teams) - available_count
     
-    log.info(f"{log_identifier} Retrieved {len(teams)} teams (filter: {status_filter})")
+    log.info("%s Retrieved %s teams (filter: %s)", log_identifier, len(teams), status_filter)
     
     return {
         "status": "success",
@@ -127,8 +237,8 @@ async def get_all_teams(
         "deployed": deployed_count,
         "summary": {
             "available": available_count,
-            "en_route": len([t for t in _teams.values() if t["status"] == "en_route"]),
-            "on_scene": len([t for t in _teams.values() if t["status"] == "on_scene"]),
+            "en_route": _count_status("en_route"),
+            "on_scene": _count_status("on_scene"),
         }
     }
 
@@ -152,14 +262,14 @@ async def get_team_details(
     log_identifier = "[GetTeamDetails]"
     
     if team_id not in _teams:
-        log.warning(f"{log_identifier} Team {team_id} not found")
+        log.warning("%s Team %s not found", log_identifier, team_id)
         return {
             "status": "error",
             "message": f"Team {team_id} not found"
         }
     
     team = _teams[team_id]
-    log.info(f"{log_identifier} Retrieved details for team {team_id}")
+    log.info("%s Retrieved details for team %s", log_identifier, team_id)
     
     return {
         "status": "success",
@@ -190,7 +300,7 @@ async def update_team_location(
     log_identifier = "[UpdateTeamLocation]"
     
     if team_id not in _teams:
-        log.warning(f"{log_identifier} Team {team_id} not found")
+        log.warning("%s Team %s not found", log_identifier, team_id)
         return {
             "status": "error",
             "message": f"Team {team_id} not found"
@@ -198,14 +308,12 @@ async def update_team_location(
     
     old_location = _teams[team_id]["location"]
     _teams[team_id]["location"] = {"lat": latitude, "lng": longitude}
-    _teams[team_id]["last_update"] = datetime.now(timezone.utc).isoformat()
+    _store_coords(team_id)
+    _teams[team_id]["last_update"] = now_iso()
     
-    # If team is assigned, recalculate ETA
-    if _teams[team_id]["assigned_to"]:
-        # Would need victim location here - simplified for now
-        log.info(f"{log_identifier} Team {team_id} location updated, ETA recalculation needed")
-    
-    log.info(f"{log_identifier} Team {team_id} location updated: ({latitude}, {longitude})")
+    # If team is assigned, its ETA needs recalculating (would need victim location - simplified for now)
+    eta_note = ", ETA recalculation needed" if _teams[team_id]["assigned_to"] else ""
+    log.info("%s Team %s location updated: (%s, %s)%s", log_identifier, team_id, latitude, longitude, eta_note)
     
     return {
         "status": "success",
@@ -239,7 +347,7 @@ async def assign_team_to_victim(
     log_identifier = "[AssignTeam]"
     
     if team_id not in _teams:
-        log.warning(f"{log_identifier} Team {team_id} not found")
+        log.warning("%s Team %s not found", log_identifier, team_id)
         return {
             "status": "error",
             "message": f"Team {team_id} not found"
@@ -248,7 +356,7 @@ async def assign_team_to_victim(
     team = _teams[team_id]
     
     if team["status"] != "available":
-        log.warning(f"{log_identifier} Team {team_id} is not available (status: {team['status']})")
+        log.warning("%s Team %s is not available (status: %s)", log_identifier, team_id, team["status"])
         return {
             "status": "error",
             "message": f"Team {team_id} is not available. Current status: {team['status']}",
@@ -266,12 +374,12 @@ async def assign_team_to_victim(
         eta_minutes = _estimate_eta(distance_km)
     
     # Update team status
-    _teams[team_id]["status"] = "en_route"
+    _set_status(team_id, "en_route")
     _teams[team_id]["assigned_to"] = victim_id
     _teams[team_id]["eta_minutes"] = eta_minutes
-    _teams[team_id]["last_update"] = datetime.now(timezone.utc).isoformat()
+    _teams[team_id]["last_update"] = now_iso()
     
-    log.info(f"{log_identifier} Team {team_id} assigned to victim {victim_id}, ETA: {eta_minutes} min")
+    log.info("%s Team %s assigned to victim %s, ETA: %s min", log_identifier, team_id, victim_id, eta_minutes)
     
     return {
         "status": "success",
@@ -305,20 +413,18 @@ async def update_team_status(
     """
     log_identifier = "[UpdateTeamStatus]"
     
-    valid_statuses = ["available", "en_route", "on_scene", "returning"]
-    
     if team_id not in _teams:
         return {"status": "error", "message": f"Team {team_id} not found"}
     
-    if status not in valid_statuses:
+    if status not in _VALID_TEAM_STATUSES:
         return {
             "status": "error",
-            "message": f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
+            "message": f"Invalid status '{status}'. Must be one of: {_VALID_TEAM_STATUSES_MSG}"
         }
     
     old_status = _teams[team_id]["status"]
-    _teams[team_id]["status"] = status
-    _teams[team_id]["last_update"] = datetime.now(timezone.utc).isoformat()
+    _set_status(team_id, status)
+    _teams[team_id]["last_update"] = now_iso()
     
     # If team is now available, clear assignment
     if status == "available":
@@ -329,7 +435,7 @@ async def update_team_status(
     if status == "on_scene":
         _teams[team_id]["eta_minutes"] = 0
     
-    log.info(f"{log_identifier} Team {team_id} status changed: {old_status} -> {status}")
+    log.info("%s Team %s status changed: %s -> %s", log_identifier, team_id, old_status, status)
     
     return {
         "status": "success",
@@ -364,12 +470,12 @@ async def release_team(
     team = _teams[team_id]
     previous_assignment = team["assigned_to"]
     
-    _teams[team_id]["status"] = "available"
+    _set_status(team_id, "available")
     _teams[team_id]["assigned_to"] = None
     _teams[team_id]["eta_minutes"] = None
-    _teams[team_id]["last_update"] = datetime.now(timezone.utc).isoformat()
+    _teams[team_id]["last_update"] = now_iso()
     
-    log.info(f"{log_identifier} Team {team_id} released from assignment {previous_assignment}")
+    log.info("%s Team %s released from assignment %s", log_identifier, team_id, previous_assignment)
     
     return {
         "status": "success",
@@ -400,10 +506,10 @@ async def get_nearest_available_team(
     """
     log_identifier = "[NearestTeam]"
     
-    available_teams = [t for t in _teams.values() if t["status"] == "available"]
+    available_teams = _teams_with_status("available")
     
     if not available_teams:
-        log.warning(f"{log_identifier} No available teams")
+        log.warning("%s No available teams", log_identifier)
         return {
             "status": "error",
             "message": "No teams currently available"
@@ -411,43 +517,41 @@ async def get_nearest_available_team(
     
     # Filter by equipment if specified
     if required_equipment:
-        available_teams = [
+        required_mask = _equipment_mask(required_equipment)
+        available_teams = [] if required_mask is None else [
             t for t in available_teams
-            if all(eq in t.get("equipment", []) for eq in required_equipment)
+            if _team_equipment[t["team_id"]] & required_mask == required_mask
         ]
         if not available_teams:
-            log.warning(f"{log_identifier} No teams with required equipment: {required_equipment}")
+            log.warning("%s No teams with required equipment: %s", log_identifier, required_equipment)
             return {
                 "status": "error",
                 "message": f"No available teams with required equipment: {required_equipment}"
             }
     
     # Calculate distances and find nearest
-    teams_with_distance = []
-    for team in available_teams:
-        distance = _calculate_distance(
-            team["location"]["lat"], team["location"]["lng"],
-            victim_location["lat"], victim_location["lng"]
-        )
-        eta = _estimate_eta(distance)
-        teams_with_distance.append({
+    distances = _distances_to(victim_location["lat"], victim_location["lng"], available_teams)
+    
+    # Only the nearest team and two alternatives are reported, so skip a full sort
+    closest = heapq.nsmallest(3, zip(available_teams, distances), key=itemgetter(1))
+    teams_with_distance = [
+        {
             "team": team,
             "distance_km": round(distance, 2),
-            "eta_minutes": eta
-        })
-    
-    # Sort by distance
-    teams_with_distance.sort(key=lambda x: x["distance_km"])
+            "eta_minutes": _estimate_eta(distance)
+        }
+        for team, distance in closest
+    ]
     nearest = teams_with_distance[0]
     
-    log.info(f"{log_identifier} Nearest team: {nearest['team']['team_id']} ({nearest['distance_km']} km)")
+    log.info("%s Nearest team: %s (%s km)", log_identifier, nearest["team"]["team_id"], nearest["distance_km"])
     
     return {
         "status": "success",
         "nearest_team": nearest["team"],
         "distance_km": nearest["distance_km"],
         "eta_minutes": nearest["eta_minutes"],
-        "alternatives": teams_with_distance[1:3] if len(teams_with_distance) > 1 else []
+        "alternatives": teams_with_distance[1:]
     }
 
 
@@ -455,7 +559,7 @@ async def get_nearest_available_team(
 def _reset_teams():
     """Reset all teams to available status."""
     for team_id in _teams:
-        _teams[team_id]["status"] = "available"
+        _set_status(team_id, "available")
         _teams[team_id]["assigned_to"] = None
         _teams[team_id]["eta_minutes"] = None
-        _teams[team_id]["last_update"] = datetime.now(timezone.utc).isoformat()
+        _teams[team_id]["last_update"] = now_iso()
@@ -8,7 +8,19 @@ severity/resources/hospital agents, and manages the priority queue.
 from typing import Any, Dict, Optional, List
 from google.adk.tools import ToolContext
 from solace_ai_connector.common.log import log
-import uuid
+import secrets
+from ..report_intake import freeze, get_host_component, incomplete_report, thaw
+
+_VALID_VICTIM_STATUSES = frozenset({"pending", "in_progress", "resolved"})
+_VALID_VICTIM_STATUSES_MSG = "pending, in_progress, resolved"
+
+# Placeholder medical supplies by severity; frozen, and copied into each queue entry
+_MEDICAL_SUPPLIES_HIGH = freeze({"priority": "HIGH", "items": ["first_aid_kit", "bandages"]})
+_MEDICAL_SUPPLIES_MEDIUM = freeze({"priority": "MEDIUM", "items": ["first_aid_kit", "bandages"]})
+
+# Placeholder hospital needs by severity; frozen, and copied into each queue entry
+_HOSPITAL_CRITICAL = freeze({"bed_type": "ICU", "urgency": "IMMEDIATE"})
+_HOSPITAL_STANDARD = freeze({"bed_type": "GENERAL", "urgency": "STANDARD"})
 
 
 async def validate_victim_report(
@@ -42,54 +54,37 @@ async def validate_victim_report(
     """
     log_identifier = "[ValidateReport]"
     
-    missing_fields = []
-    next_question = None
-    
-    # Check location
-    has_coordinates = latitude is not None and longitude is not None
-    has_location_desc = location is not None and len(str(location).strip()) > 0
-    
-    if not has_coordinates and not has_location_desc:
-        missing_fields.append("location")
-        next_question = "What is your exact location? Please provide either an address/landmark or GPS coordinates."
+    has_location = (
+        (latitude is not None and longitude is not None)
+        or (location is not None and bool(str(location).strip()))
+    )
+    has_description = bool(description) and len(str(description).strip()) >= 5
+    has_num_people = num_people is not None and num_people >= 1
     
-    # Check description
-    if not description or len(str(description).strip()) < 5:
-        missing_fields.append("description")
-        if next_question is None:
-            next_question = "Can you describe what happened? Please include details about any injuries, hazards, or urgent conditions."
+    # The missing-field list is only built for incomplete reports
+    if not (has_location and has_description and has_num_people):
+        missing_fields = [
+            field for field, present in (
+                ("location", has_location),
+                ("description", has_description),
+                ("num_people", has_num_people),
+            ) if not present
+        ]
+        return incomplete_report(log_identifier, missing_fields)
     
-    # Check number of people
-    if num_people is None or num_people < 1:
-        missing_fields.append("num_people")
-        if next_question is None:
-            next_question = "How many people need assistance?"
-    
-    is_valid = len(missing_fields) == 0
-    
-    if is_valid:
-        log.info(f"{log_identifier} Report validation successful - all required fields present")
-        return {
-            "status": "success",
-            "is_valid": True,
-            "message": "All required information collected",
-            "data": {
-                "location": location,
-                "latitude": latitude,
-                "longitude": longitude,
-                "description": description,
-                "num_people": num_people
-            }
-        }
-    else:
-        log.info(f"{log_identifier} Report incomplete - missing: {', '.join(missing_fields)}")
-        return {
-            "status": "incomplete",
-            "is_valid": False,
-            "missing_fields": missing_fields,
-            "next_question": next_question,
-            "message": f"Missing required information: {', '.join(missing_fields)}"
+    log.info("%s Report validation successful - all required fields present", log_identifier)
+    return {
+        "status": "success",
+        "is_valid": True,
+        "message": "All required information collected",
+        "data": {
+            "location": location,
+            "latitude": latitude,
+            "longitude": longitude,
+            "description": description,
+            "num_people": num_people
         }
+    }
 
 
 async def process_validated_report(
@@ -127,25 +122,18 @@ async def process_validated_report(
     log_identifier = "[ProcessReport]"
     
     if not tool_context:
+        log.error("%s No tool context for report at (%s, %s)", log_identifier, latitude, longitude)
         return {"status": "error", "message": "Tool context required"}
     
     try:
         # Generate unique victim ID
-        victim_id = f"V-{uuid.uuid4().hex[:8]}"
-        
-        log.info(f"{log_identifier} Processing report for {victim_id} with severity {severity_score}/10")
-        
-        # Get host component
-        host_component = getattr(tool_context._invocation_context, "agent", None)
-        if host_component:
-            host_component = getattr(host_component, "host_component", None)
+        victim_id = f"V-{secrets.randbits(32):08x}"
         
+        host_component = get_host_component(tool_context)
         if not host_component:
+            log.error("%s No host component for report at (%s, %s)", log_identifier, latitude, longitude)
             return {"status": "error", "message": "Could not access agent host component"}
         
-        # Log immediate location
-        log.info(f"{log_identifier} [IMMEDIATE] Location: {latitude}, {longitude}")
-        
         # Use the severity score from SeverityAgent
         severity_result = {
             "score": severity_score,
@@ -157,18 +145,16 @@ async def process_validated_report(
         resources_result = {
             "food": {"priority": "MEDIUM", "quantity": num_people},
             "water": {"priority": "HIGH", "quantity": num_people * 2},
-            "medical_supplies": {"priority": "HIGH" if severity_score >= 7 else "MEDIUM", "items": ["first_aid_kit", "bandages"]}
+            "medical_supplies": thaw(_MEDICAL_SUPPLIES_HIGH if severity_score >= 7 else _MEDICAL_SUPPLIES_MEDIUM)
         }
         
         # Hospital needs placeholder
-        hospital_result = {
-            "bed_type": "ICU" if severity_score >= 9 else "GENERAL",
-            "urgency": "IMMEDIATE" if severity_score >= 9 else "STANDARD"
-        }
+        hospital_result = thaw(_HOSPITAL_CRITICAL if severity_score >= 9 else _HOSPITAL_STANDARD)
         
         # Get priority queue service
         queue_service = host_component.get_agent_specific_state("queue_service")
         if not queue_service:
+            log.error("%s Queue service not initialized for report at (%s, %s)", log_identifier, latitude, longitude)
             return {"status": "error", "message": "Priority queue service not initialized"}
         
         # Add to priority queue
@@ -190,7 +176,11 @@ async def process_validated_report(
         total = host_component.get_agent_specific_state("total_victims_processed", 0)
         host_component.set_agent_specific_state("total_victims_processed", total + 1)
         
-        log.info(f"{log_identifier} Successfully processed {victim_id}, queue position: {queue_result['position']}")
+        # One line per report; every error path logs the location too
+        log.info(
+            "%s Processed %s: severity %s/10, location (%s, %s), queue position %s",
+            log_identifier, victim_id, severity_score, latitude, longitude, queue_result["position"]
+        )
         
         return {
             "status": "success",
@@ -203,7 +193,7 @@ async def process_validated_report(
         }
         
     except Exception as e:
-        log.error(f"{log_identifier} Error processing report: {e}")
+        log.error("%s Error processing report at (%s, %s): %s", log_identifier, latitude, longitude, e)
         return {
             "status": "error",
             "message": f"Failed to process report: {str(e)}"
@@ -234,11 +224,7 @@ async def get_priority_queue(
         return {"status": "error", "message": "Tool context required"}
     
     try:
-        # Get host component
-        host_component = getattr(tool_context._invocation_context, "agent", None)
-        if host_component:
-            host_component = getattr(host_component, "host_component", None)
-        
+        host_component = get_host_component(tool_context)
         if not host_component:
             return {"status": "error", "message": "Could not access agent host component"}
         
@@ -253,12 +239,12 @@ async def get_priority_queue(
             status_filter=status_filter
         )
         
-        log.info(f"{log_identifier} Retrieved {len(queue_result.get('victims', []))} victims from queue")
+        log.info("%s Retrieved %s victims from queue", log_identifier, len(queue_result.get("victims", [])))
         
         return queue_result
         
     except Exception as e:
-        log.error(f"{log_identifier} Error getting priority queue: {e}")
+        log.error("%s Error getting priority queue: %s", log_identifier, e)
         return {
             "status": "error",
             "message": f"Failed to get priority queue: {str(e)}"
@@ -288,19 +274,14 @@ async def update_victim_status(
     if not tool_context:
         return {"status": "error", "message": "Tool context required"}
     
-    valid_statuses = ["pending", "in_progress", "resolved"]
-    if status not in valid_statuses:
+    if status not in _VALID_VICTIM_STATUSES:
         return {
             "status": "error",
-            "message": f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
+            "message": f"Invalid status '{status}'. Must be one of: {_VALID_VICTIM_STATUSES_MSG}"
         }
     
     try:
-        # Get host component
-        host_component = getattr(tool_context._invocation_context, "agent", None)
-        if host_component:
-            host_component = getattr(host_component, "host_component", None)
-        
+        host_component = get_host_component(tool_context)
         if not host_component:
             return {"status": "error", "message": "Could not access agent host component"}
         
@@ -313,7 +294,7 @@ async def update_victim_status(
         update_result = await queue_service.update_victim_status(victim_id, status)
         
         if update_result.get("success"):
-            log.info(f"{log_identifier} Updated {victim_id} status to '{status}'")
+            log.info("%s Updated %s status to '%s'", log_identifier, victim_id, status)
             return {
                 "status": "success",
                 "victim_id": victim_id,
@@ -328,7 +309,7 @@ async def update_victim_status(
             }
         
     except Exception as e:
-        log.error(f"{log_identifier} Error updating victim status: {e}")
+        log.error("%s Error updating victim status: %s", log_identifier, e)
         return {
             "status": "error",
             "message": f"Failed to update status: {str(e)}"
@@ -357,11 +338,7 @@ async def get_victim_details(
         return {"status": "error", "message": "Tool context required"}
     
     try:
-        # Get host component
-        host_component = getattr(tool_context._invocation_context, "agent", None)
-        if host_component:
-            host_component = getattr(host_component, "host_component", None)
-        
+        host_component = get_host_component(tool_context)
         if not host_component:
             return {"status": "error", "message": "Could not access agent host component"}
         
@@ -374,7 +351,7 @@ async def get_victim_details(
         victim = await queue_service.get_victim_by_id(victim_id)
         
         if victim:
-            log.info(f"{log_identifier} Retrieved details for victim {victim_id}")
+            log.info("%s Retrieved details for victim %s", log_identifier, victim_id)
             return {
                 "status": "success",
                 "victim": victim
@@ -386,7 +363,7 @@ async def get_victim_details(
             }
         
     except Exception as e:
-        log.error(f"{log_identifier} Error getting victim details: {e}")
+        log.error("%s Error getting victim details: %s", log_identifier, e)
         return {
             "status": "error",
             "message": f"Failed to get victim details: {str(e)}"
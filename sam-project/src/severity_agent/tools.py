@@ -5,10 +5,79 @@ This agent analyzes victim descriptions and assigns severity scores 1-10
 for emergency triage prioritization.
 """
 
-from typing import Any, Dict, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional
 from google.adk.tools import ToolContext
 from solace_ai_connector.common.log import log
 
+# Severity bands, highest first: (base_score, keywords)
+_SEVERITY_BANDS = (
+    (9, (
+        'unconscious', 'not breathing', 'no pulse', 'severe bleeding',
+        'cardiac arrest', 'heart attack', 'stroke', 'severe burns',
+        'multiple injuries', 'crushed', 'impaled'
+    )),
+    (7, (
+        'bleeding', 'fracture', 'broken bone', 'chest pain',
+        'difficulty breathing', 'severe pain', 'head injury',
+        'internal bleeding', 'moderate burns', 'deep cut'
+    )),
+    (5, (
+        'injured', 'pain', 'cut', 'laceration', 'sprain',
+        'minor burn', 'bruised', 'trapped', 'stuck'
+    )),
+    (3, (
+        'bruise', 'scratch', 'anxiety', 'scared', 'shaken',
+        'minor injury', 'superficial'
+    )),
+)
+
+# Risk modifiers: (score_adjustment, modifier, keywords)
+_MODIFIERS = (
+    # Vulnerability modifiers
+    (1, "vulnerable: child", ('child', 'baby', 'infant', 'toddler')),
+    (1, "vulnerable: elderly", ('elderly', 'senior', 'old')),
+    (1, "vulnerable: pregnant", ('pregnant', 'pregnancy')),
+    # Environmental threat modifiers
+    (2, "threat: fire", ('fire', 'smoke', 'burning', 'flames')),
+    (2, "threat: structural collapse", ('collapse', 'collapsing', 'rubble', 'debris')),
+    (1, "threat: flooding", ('flood', 'flooding', 'water rising', 'drowning')),
+    (2, "threat: hazardous materials", ('gas leak', 'chemical', 'toxic')),
+    # Medical complication modifiers
+    (1, "medical: diabetes", ('diabetes', 'diabetic', 'insulin')),
+    (1, "medical: cardiac condition", ('heart condition', 'cardiac', 'pacemaker')),
+    (1, "medical: medication dependent", ('medication', 'medicine', 'prescription')),
+)
+
+# Priority level names by minimum score, ascending for bisect
+_PRIORITY_THRESHOLDS = (0, 3, 5, 7, 9)
+_PRIORITY_NAMES = ("NON-URGENT", "MINOR", "SERIOUS", "URGENT", "CRITICAL")
+
+# Every keyword once, so a description is scanned in a single pass
+_ALL_KEYWORDS = tuple(dict.fromkeys(
+    [kw for _, keywords in _SEVERITY_BANDS for kw in keywords]
+    + [kw for _, _, keywords in _MODIFIERS for kw in keywords]
+))
+
+
+@lru_cache(maxsize=256)
+def _match_keywords(description: str) -> FrozenSet[str]:
+    """
+    Lowercase a description once and return every known keyword it contains.
+
+    Memoized on the raw description, so a report that is re-analyzed (retries,
+    re-triage after a status change) skips the lowercasing and scan entirely.
+
+    Args:
+        description: Victim situation description
+
+    Returns:
+        Frozen set of matched keywords from _ALL_KEYWORDS
+    """
+    lower_desc = description.lower()
+    return frozenset(kw for kw in _ALL_KEYWORDS if kw in lower_desc)
+
 
 async def analyze_severity(
     description: str,
@@ -36,7 +105,7 @@ async def analyze_severity(
         Dictionary with severity score, reasoning, and keywords
     """
     log_identifier = "[SeverityAnalysis]"
-    log.info(f"{log_identifier} Analyzing severity for victim {victim_id}")
+    log.info("%s Analyzing severity for victim %s", log_identifier, victim_id)
     
     if not description or len(description.strip()) < 5:
         return {
@@ -46,94 +115,30 @@ async def analyze_severity(
         }
     
     try:
-        lower_desc = description.lower()
-        
-        # Define keyword categories for severity assessment
-        critical_keywords = [
-            'unconscious', 'not breathing', 'no pulse', 'severe bleeding',
-            'cardiac arrest', 'heart attack', 'stroke', 'severe burns',
-            'multiple injuries', 'crushed', 'impaled'
-        ]
+        # One pass over all keywords; bands and modifiers are read from the matches
+        found = _match_keywords(description)
         
-        urgent_keywords = [
-            'bleeding', 'fracture', 'broken bone', 'chest pain',
-            'difficulty breathing', 'severe pain', 'head injury',
-            'internal bleeding', 'moderate burns', 'deep cut'
-        ]
-        
-        serious_keywords = [
-            'injured', 'pain', 'cut', 'laceration', 'sprain',
-            'minor burn', 'bruised', 'trapped', 'stuck'
-        ]
-        
-        minor_keywords = [
-            'bruise', 'scratch', 'anxiety', 'scared', 'shaken',
-            'minor injury', 'superficial'
-        ]
-        
-        # Calculate base score from keywords
+        # Calculate base score from the highest band with a match
         base_score = 2  # Default: non-urgent
         identified_keywords = []
         
-        if any(kw in lower_desc for kw in critical_keywords):
-            base_score = 9
-            identified_keywords.extend([kw for kw in critical_keywords if kw in lower_desc])
-        elif any(kw in lower_desc for kw in urgent_keywords):
-            base_score = 7
-            identified_keywords.extend([kw for kw in urgent_keywords if kw in lower_desc])
-        elif any(kw in lower_desc for kw in serious_keywords):
-            base_score = 5
-            identified_keywords.extend([kw for kw in serious_keywords if kw in lower_desc])
-        elif any(kw in lower_desc for kw in minor_keywords):
-            base_score = 3
-            identified_keywords.extend([kw for kw in minor_keywords if kw in lower_desc])
+        if found:
+            for band_score, keywords in _SEVERITY_BANDS:
+                hits = [kw for kw in keywords if kw in found]
+                if hits:
+                    base_score = band_score
+                    identified_keywords = hits
+                    break
         
         # Apply modifiers based on additional risk factors
         final_score = base_score
         modifiers = []
         
-        # Vulnerability modifiers
-        if any(word in lower_desc for word in ['child', 'baby', 'infant', 'toddler']):
-            final_score = min(10, final_score + 1)
-            modifiers.append("vulnerable: child")
-        
-        if any(word in lower_desc for word in ['elderly', 'senior', 'old']):
-            final_score = min(10, final_score + 1)
-            modifiers.append("vulnerable: elderly")
-        
-        if any(word in lower_desc for word in ['pregnant', 'pregnancy']):
-            final_score = min(10, final_score + 1)
-            modifiers.append("vulnerable: pregnant")
-        
-        # Environmental threat modifiers
-        if any(word in lower_desc for word in ['fire', 'smoke', 'burning', 'flames']):
-            final_score = min(10, final_score + 2)
-            modifiers.append("threat: fire")
-        
-        if any(word in lower_desc for word in ['collapse', 'collapsing', 'rubble', 'debris']):
-            final_score = min(10, final_score + 2)
-            modifiers.append("threat: structural collapse")
-        
-        if any(word in lower_desc for word in ['flood', 'flooding', 'water rising', 'drowning']):
-            final_score = min(10, final_score + 1)
-            modifiers.append("threat: flooding")
-        
-        if any(word in lower_desc for word in ['gas leak', 'chemical', 'toxic']):
-            final_score = min(10, final_score + 2)
-            modifiers.append("threat: hazardous materials")
-        
-        # Medical complication modifiers
-        if any(word in lower_desc for word in ['diabetes', 'diabetic', 'insulin']):
-            final_score = min(10, final_score + 1)
-            modifiers.append("medical: diabetes")
-        
-        if any(word in lower_desc for word in ['heart condition', 'cardiac', 'pacemaker']):
-            final_score = min(10, final_score + 1)
-            modifiers.append("medical: cardiac condition")
-        
-        if any(word in lower_desc for word in ['medication', 'medicine', 'prescription']):
-            final_score = min(10, final_score + 1)
-            modifiers.append("medical: medication dependent")
+        if found:
+            for adjustment, modifier, keywords in _MODIFIERS:
+                if not found.isdisjoint(keywords):
+                    final_score = min(10, final_score + adjustment)
+                    modifiers.append(modifier)
         
         # Build reasoning string
         if modifiers:
@@ -142,16 +147,7 @@ async def analyze_severity(
             reasoning = f"Severity assessed at {final_score}/10 based on injury description."
         
         # Determine priority level name
-        if final_score >= 9:
-            priority_level = "CRITICAL"
-        elif final_score >= 7:
-            priority_level = "URGENT"
-        elif final_score >= 5:
-            priority_level = "SERIOUS"
-        elif final_score >= 3:
-            priority_level = "MINOR"
-        else:
-            priority_level = "NON-URGENT"
+        priority_level = _PRIORITY_NAMES[bisect_right(_PRIORITY_THRESHOLDS, final_score) - 1]
         
         result = {
             "status": "success",
@@ -163,11 +159,11 @@ async def analyze_severity(
             "modifiers": modifiers
         }
         
-        log.info(f"{log_identifier} Analysis complete: {priority_level} ({final_score}/10) for victim {victim_id}")
+        log.info("%s Analysis complete: %s (%s/10) for victim %s", log_identifier, priority_level, final_score, victim_id)
         return result
         
     except Exception as e:
-        log.error(f"{log_identifier} Error analyzing severity: {e}")
+        log.error("%s Error analyzing severity: %s", log_identifier, e)
         return {
             "status": "error",
             "victim_id": victim_id,
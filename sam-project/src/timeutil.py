@@ -0,0 +1,22 @@
+"""
+Timestamp helper shared by the agents and the API.
+
+Queue entries and team records are stamped in bursts, so the ISO string
+for the current millisecond is built once and reused.
+"""
+
+import time
+from datetime import datetime, timezone
+
+_ts_cache = (0, "")  # (monotonic_ns, iso string) of the last call
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO string, reused for calls within the same millisecond."""
+    global _ts_cache
+    now_ns = time.monotonic_ns()
+    cached_ns, cached_iso = _ts_cache
+    if now_ns - cached_ns > 1_000_000:
+        cached_iso = datetime.now(timezone.utc).isoformat()
+        _ts_cache = (now_ns, cached_iso)
+    return cached_iso
@@ -0,0 +1,61 @@
+"""
+Tests for the standalone REST API server's resource allocation.
+"""
+
+import sys
+import os
+import asyncio
+import copy
+
+import pytest
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.api import server
+
+
+@pytest.fixture(autouse=True)
+def restore_inventory():
+    """Allocations change the module-level inventory; put it back after each test."""
+    saved = copy.deepcopy(server.inventory)
+    yield
+    server.inventory.clear()
+    server.inventory.update(saved)
+
+
+def _allocate(equipment_list):
+    request = server.ResourceAllocationRequest(equipment_list=equipment_list)
+    return asyncio.run(server.allocate_resources(request))
+
+
+def test_required_equipment_is_allocated_first_when_stock_is_short():
+    """A required line gets scarce stock ahead of a recommended line listed before it."""
+    # Four hydraulic cutters in stock for six requested
+    result = _allocate([
+        {"item": "hydraulic_cutter", "quantity": 3, "priority": "recommended"},
+        {"item": "stretcher", "quantity": 2, "priority": "optional"},
+        {"item": "hydraulic_cutter", "quantity": 3, "priority": "required"},
+    ])
+
+    assert result["equipment_assigned"] == [
+        {"item": "hydraulic_cutter", "quantity": 3},  # Required, in full
+        {"item": "hydraulic_cutter", "quantity": 1},  # Recommended gets what is left
+        {"item": "stretcher", "quantity": 2},
+    ]
+    assert result["shortfall"] == [{"item": "hydraulic_cutter", "needed": 3, "available": 1}]
+    assert result["allocated"] is False
+    assert server.inventory["hydraulic_cutter"]["available"] == 0
+
+
+def test_items_of_equal_priority_keep_request_order():
+    """Within a priority the request order decides, and unknown priorities go last."""
+    result = _allocate([
+        {"item": "oxygen_tank", "quantity": 1},
+        {"item": "defibrillator", "quantity": 1, "priority": "required"},
+        {"item": "stretcher", "quantity": 1, "priority": "required"},
+    ])
+
+    assert [item["item"] for item in result["equipment_assigned"]] == ["defibrillator", "stretcher", "oxygen_tank"]
+    assert result["allocated"] is True
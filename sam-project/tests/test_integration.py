@@ -39,12 +39,43 @@ from modules.rescue_tools import (
     estimate_arrival_time
 )
 
+# Banner chrome, built once
+_RULE = "=" * 70
+_BOX_LINE = "═" * 68
+_BOX_TOP = f"╔{_BOX_LINE}╗"
+_BOX_DIVIDER = f"╠{_BOX_LINE}╣"
+_BOX_BOTTOM = f"╚{_BOX_LINE}╝"
+
+# Incoming call for the building-collapse scenario
+_VICTIM_MESSAGE = """
+    EMERGENCY! There's been a building collapse at 45 Sukhumvit Road, Bangkok!
+    5 people are trapped including 2 children. Three adults are bleeding heavily 
+    and one child is unconscious. There's smoke and small fires in the debris.
+    Our GPS coordinates are 13.7563, 100.5018. Please send help immediately!
+    """
+
+# Step 11 mission summary; fields are padded to the box width, longer values overflow it,
+# and only the location is truncated (to 43 characters)
+_MISSION_SUMMARY = """
+    ╔══════════════════════════════════════════════════════════════════╗
+    ║                     🚨 MISSION DEPLOYMENT 🚨                     ║
+    ╠══════════════════════════════════════════════════════════════════╣
+    ║  Victim ID:     {victim_id:<48} ║
+    ║  Priority:      {priority:<48} ║
+    ║  Location:      {location:<48.43} ║
+    ║  Scenario:      {scenario:<48} ║
+    ╠══════════════════════════════════════════════════════════════════╣
+    ║  Team:          {team:<48} ║
+    ║  Personnel:     {personnel:<48} ║
+    ║  Equipment:     {equipment:<48} ║
+    ║  ETA:           {eta:<48} ║
+    ╚══════════════════════════════════════════════════════════════════╝
+    """.format
+
 
 def print_header(title: str):
     """Print formatted section header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+    print(f"\n{_RULE}\n  {title}\n{_RULE}")
 
 
 def print_subheader(title: str):
@@ -70,10 +101,10 @@ def test_full_disaster_rescue_workflow():
     """
     
     print("\n")
-    print("╔" + "═" * 68 + "╗")
-    print("║" + " " * 10 + "DISASTER RESCUE SYSTEM - FULL INTEGRATION TEST" + " " * 11 + "║")
-    print("║" + " " * 20 + "Person A + Person B Components" + " " * 17 + "║")
-    print("╚" + "═" * 68 + "╝")
+    print(_BOX_TOP)
+    print(f"║{'DISASTER RESCUE SYSTEM - FULL INTEGRATION TEST'.center(68)}║")
+    print(f"║{'Person A + Person B Components'.center(68)}║")
+    print(_BOX_BOTTOM)
     
     # Reset state
     _reset_inventory()
@@ -84,16 +115,9 @@ def test_full_disaster_rescue_workflow():
     # =========================================================================
     print_header("SCENARIO: Building Collapse Emergency")
     
-    victim_message = """
-    EMERGENCY! There's been a building collapse at 45 Sukhumvit Road, Bangkok!
-    5 people are trapped including 2 children. Three adults are bleeding heavily 
-    and one child is unconscious. There's smoke and small fires in the debris.
-    Our GPS coordinates are 13.7563, 100.5018. Please send help immediately!
-    """
-    
     print(f"\n📞 INCOMING EMERGENCY CALL:")
     print("-" * 50)
-    print(victim_message)
+    print(_VICTIM_MESSAGE)
     print("-" * 50)
     
     # =========================================================================
@@ -101,7 +125,7 @@ def test_full_disaster_rescue_workflow():
     # =========================================================================
     print_header("STEP 1: Master Agent - Parse Emergency Message")
     
-    parsed = parse_victim_message(victim_message)
+    parsed = parse_victim_message(_VICTIM_MESSAGE)
     
     print(f"  📋 Parsed Information:")
     print(f"     • Detected Severity: {parsed['detected_severity']}")
@@ -120,7 +144,7 @@ def test_full_disaster_rescue_workflow():
     # =========================================================================
     print_header("STEP 2: Master Agent - Extract Location")
     
-    location = extract_location(victim_message)
+    location = extract_location(_VICTIM_MESSAGE)
     
     print(f"  📍 Extracted Location:")
     print(f"     • Latitude: {location['lat']}")
@@ -232,11 +256,14 @@ def test_full_disaster_rescue_workflow():
     for item in equipment_calc['equipment']:
         print(f"       - {item['item']}: {item['quantity']} ({item['priority']})")
     
+    # Index the list once; steps 6 and 7 look items up by name
+    equipment_by_item = {e['item']: e for e in equipment_calc['equipment']}
+    
     # Should have stretchers = 5 (1 per victim)
-    stretchers = next(e for e in equipment_calc['equipment'] if e['item'] == 'stretcher')
+    stretchers = equipment_by_item['stretcher']
     assert stretchers['quantity'] == 5, "Should need 5 stretchers"
     # Should have pediatric_kit for children
-    has_pediatric = any(e['item'] == 'pediatric_kit' for e in equipment_calc['equipment'])
+    has_pediatric = 'pediatric_kit' in equipment_by_item
     assert has_pediatric, "Should include pediatric_kit for children"
     print("\n  ✅ Equipment calculation PASSED")
     
@@ -245,8 +272,9 @@ def test_full_disaster_rescue_workflow():
     # =========================================================================
     print_header("STEP 7: Rescue Agent - Calculate Personnel Needs")
     
-    heavy_equipment_count = len([e for e in equipment_calc['equipment'] 
-                                  if e['item'] in ['hydraulic_cutter', 'concrete_saw', 'airbag_lifter']])
+    heavy_equipment_count = sum(
+        1 for item in ('hydraulic_cutter', 'concrete_saw', 'airbag_lifter') if item in equipment_by_item
+    )
     
     personnel_calc = calculate_personnel(
         scenario_type=scenario_type,
@@ -292,7 +320,8 @@ def test_full_disaster_rescue_workflow():
     # =========================================================================
     print_header("STEP 9: Resource Agent - Allocate Resources")
     
-    timestamp = int(time.time())
+    # Only an ID suffix: monotonic ns stay unique across rapid re-runs in one process
+    timestamp = time.monotonic_ns()
     
     allocation = allocate_resources(
         request_id=f"REQ-{timestamp}",
@@ -348,21 +377,16 @@ def test_full_disaster_rescue_workflow():
     # =========================================================================
     print_header("STEP 11: Mission Deployment Summary")
     
-    print(f"""
-    ╔══════════════════════════════════════════════════════════════════╗
-    ║                    🚨 MISSION DEPLOYMENT 🚨                       ║
-    ╠══════════════════════════════════════════════════════════════════╣
-    ║  Victim ID:     {victim_report['victim_id']:<47} ║
-    ║  Priority:      {victim_report['priority_level']} (Score: {victim_report['priority_score']})                              ║
-    ║  Location:      {location['address'][:43]:<43} ║
-    ║  Scenario:      {scenario_type:<47} ║
-    ╠══════════════════════════════════════════════════════════════════╣
-    ║  Team:          {allocation['team_id']:<47} ║
-    ║  Personnel:     {personnel_calc['minimum_personnel']} minimum ({personnel_calc['recommended_personnel']} recommended)                       ║
-    ║  Equipment:     {len(allocation['equipment_assigned'])} items assigned                                ║
-    ║  ETA:           {route['estimated_time_minutes']} minutes ({route['distance_km']} km)                             ║
-    ╚══════════════════════════════════════════════════════════════════╝
-    """)
+    print(_MISSION_SUMMARY(
+        victim_id=victim_report['victim_id'],
+        priority=f"{victim_report['priority_level']} (Score: {victim_report['priority_score']})",
+        location=location['address'],
+        scenario=scenario_type,
+        team=allocation['team_id'],
+        personnel=f"{personnel_calc['minimum_personnel']} minimum ({personnel_calc['recommended_personnel']} recommended)",
+        equipment=f"{len(allocation['equipment_assigned'])} items assigned",
+        eta=f"{route['estimated_time_minutes']} minutes ({route['distance_km']} km)"
+    ))
     
     # =========================================================================
     # STEP 12: Mission complete - Release resources
@@ -389,9 +413,10 @@ def test_full_disaster_rescue_workflow():
     # FINAL SUMMARY
     # =========================================================================
     print("\n")
-    print("╔" + "═" * 68 + "╗")
-    print("║" + " " * 15 + "🎉 ALL INTEGRATION TESTS PASSED! 🎉" + " " * 16 + "║")
-    print("╠" + "═" * 68 + "╣")
+    print(_BOX_TOP)
+    # The two emoji render double-width, so center in 66 columns
+    print(f"║{'🎉 ALL INTEGRATION TESTS PASSED! 🎉'.center(66)}║")
+    print(_BOX_DIVIDER)
     print("║  Person A Components:                                              ║")
     print("║    ✅ prioritizer.py      - Priority scoring                       ║")
     print("║    ✅ location_utils.py   - Location extraction                    ║")
@@ -409,7 +434,7 @@ def test_full_disaster_rescue_workflow():
     print("║    ✅ resource_agent.yaml - Resource Agent config                  ║")
     print("║    ✅ rescue_agent.yaml   - Rescue Agent config                    ║")
     print("║    ✅ rest_gateway.yaml   - REST API Gateway config                ║")
-    print("╚" + "═" * 68 + "╝")
+    print(_BOX_BOTTOM)
 
 
 if __name__ == "__main__":
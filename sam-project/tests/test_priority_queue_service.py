@@ -0,0 +1,258 @@
+"""
+Tests for the Orchestrator's PriorityQueueService persistence.
+
+Runs the service against an in-memory artifact store and records every
+artifact write, so the tests can check what reaches storage.
+"""
+
+import sys
+import os
+import asyncio
+import functools
+
+import orjson
+import pytest
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.main_orchestrator.services import priority_queue_service as pqs
+from src.main_orchestrator.services.priority_queue_service import PriorityQueueService
+
+
+class FakeArtifactService:
+    """In-memory artifact store that records every write."""
+
+    def __init__(self):
+        self.artifacts = {}
+        self.writes = []  # (filename, content_bytes) in write order
+
+    async def load_artifact(self, app_name, user_id, filename, **kwargs):
+        content = self.artifacts.get(filename)
+        return {"content": content} if content is not None else None
+
+
+async def _fake_save_artifact_with_metadata(artifact_service, filename, content_bytes, **kwargs):
+    artifact_service.artifacts[filename] = content_bytes
+    artifact_service.writes.append((filename, content_bytes))
+    return {"status": "success"}
+
+
+@pytest.fixture
+def artifacts(monkeypatch):
+    """Artifact store wired in place of SAM's artifact helper."""
+    monkeypatch.setattr(pqs, "save_artifact_with_metadata", _fake_save_artifact_with_metadata)
+    return FakeArtifactService()
+
+
+def run_async(test):
+    """Run an async test function to completion on a fresh event loop."""
+    @functools.wraps(test)
+    def wrapper(*args, **kwargs):
+        return asyncio.run(test(*args, **kwargs))
+    return wrapper
+
+
+async def _add_victim(service, i):
+    return await service.add_or_update_victim(
+        victim_id=f"V-{i:08x}",
+        score=1 + i % 10,
+        location={"lat": 13.7 + i / 1000, "lng": 100.5, "description": f"Building {i}"},
+        description="Trapped under debris with a leg injury",
+        resources={"water": {"priority": "HIGH", "quantity": 2}},
+        hospital_needs={"bed_type": "GENERAL", "urgency": "STANDARD"},
+    )
+
+
+async def _victims(service, limit=100):
+    """The queue as stored: victim entries in priority order, round-tripped through JSON."""
+    victims = (await service.get_priority_queue(limit=limit))["victims"]
+    return orjson.loads(orjson.dumps(victims, default=str))
+
+
+@run_async
+async def test_flush_never_writes_more_than_a_full_save(artifacts):
+    """Each flush writes at most what rewriting the whole queue would."""
+    service = PriorityQueueService(artifacts, "test-app")
+    for i in range(30):
+        await _add_victim(service, i)
+    assert await service.save_queue()
+
+    total_written = 0
+    total_full_saves = 0
+    for n in range(300):
+        # Flush after every mutation: the worst case for the journal
+        threshold = max(pqs.JOURNAL_COMPACT_BYTES, len(artifacts.artifacts[service.queue_filename]))
+        await service.update_victim_status(f"V-{n % 30:08x}", ("pending", "in_progress", "resolved")[n % 3])
+        expected = await _victims(service)
+        full_save_bytes = len(orjson.dumps(expected))
+
+        del artifacts.writes[:]
+        assert await service.flush()
+        written = sum(len(content) for _, content in artifacts.writes)
+
+        # Either the journal, kept under the threshold, or a compacted snapshot
+        assert written <= max(threshold, full_save_bytes)
+        total_written += written
+        total_full_saves += full_save_bytes
+
+    # Journaling must beat rewriting the whole queue on every mutation
+    assert total_written < total_full_saves
+
+    # And what was written still reloads to the same queue
+    reloaded = PriorityQueueService(artifacts, "test-app")
+    assert await _victims(reloaded) == expected
+
+
+@run_async
+async def test_mutation_during_cold_load_is_kept(artifacts):
+    """A mutation that arrives while the first load is in flight survives it."""
+    seeded = PriorityQueueService(artifacts, "test-app")
+    for i in range(3):
+        await _add_victim(seeded, i)
+    assert await seeded.save_queue()
+    await seeded.flush()
+
+    load_artifact = artifacts.load_artifact
+
+    async def slow_load_artifact(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return await load_artifact(*args, **kwargs)
+
+    artifacts.load_artifact = slow_load_artifact
+    service = PriorityQueueService(artifacts, "test-app")
+    loading = asyncio.create_task(service.get_queue_size())
+    await asyncio.sleep(0)
+    await _add_victim(service, 3)
+    await loading
+
+    expected = await _victims(service)
+    assert [entry["victim_id"] for entry in expected] == ["V-00000003", "V-00000002", "V-00000001", "V-00000000"]
+    assert await service.flush()
+
+    reloaded = PriorityQueueService(artifacts, "test-app")
+    assert await _victims(reloaded) == expected
+
+
+@run_async
+async def test_failed_flush_keeps_the_queue(artifacts, monkeypatch):
+    """A flush whose save fails keeps the unsaved queue in memory."""
+    service = PriorityQueueService(artifacts, "test-app")
+    for i in range(3):
+        await _add_victim(service, i)
+    expected = await _victims(service)
+
+    async def failing_save(*args, **kwargs):
+        return {"status": "error", "message": "storage unavailable"}
+
+    monkeypatch.setattr(pqs, "save_artifact_with_metadata", failing_save)
+    assert not await service.flush()
+    assert await _victims(service) == expected
+
+    monkeypatch.setattr(pqs, "save_artifact_with_metadata", _fake_save_artifact_with_metadata)
+    assert await service.flush()
+    reloaded = PriorityQueueService(artifacts, "test-app")
+    assert await _victims(reloaded) == expected
+
+
+@run_async
+async def test_snapshot_is_a_json_array(artifacts):
+    """Snapshots are saved as a JSON array in priority order."""
+    service = PriorityQueueService(artifacts, "test-app")
+    for i in range(3):
+        await _add_victim(service, i)
+    assert await service.save_queue()
+
+    entries = orjson.loads(artifacts.artifacts[service.queue_filename])
+    assert entries == (await service.get_top_priorities(n=3))["victims"]
+    await service.flush()
+
+
+def _failing_load(artifacts, failing):
+    """Make load_artifact raise for the filenames in `failing`."""
+    load_artifact = artifacts.load_artifact
+
+    async def load(app_name, user_id, filename, **kwargs):
+        if filename in failing:
+            raise ConnectionError(f"cannot read {filename}")
+        return await load_artifact(app_name, user_id, filename, **kwargs)
+
+    artifacts.load_artifact = load
+
+
+@run_async
+async def test_unreadable_snapshot_is_never_overwritten(artifacts):
+    """If the snapshot cannot be read the queue keeps working, degraded, without writing over it."""
+    seeded = PriorityQueueService(artifacts, "test-app")
+    for i in range(3):
+        await _add_victim(seeded, i)
+    assert await seeded.save_queue()
+    assert await seeded.flush()
+    stored = dict(artifacts.artifacts)
+
+    failing = {seeded.queue_filename}
+    _failing_load(artifacts, failing)
+    service = PriorityQueueService(artifacts, "test-app")
+    await _add_victim(service, 3)
+    assert service.degraded
+    assert await service.get_queue_size() == 1
+
+    # Nothing may be written while the stored snapshot is unread
+    assert not await service.flush()
+    assert artifacts.artifacts == stored
+
+    # Once storage recovers the stored queue is merged under the new victim
+    failing.clear()
+    assert await service.flush()
+    assert not service.degraded
+    reloaded = PriorityQueueService(artifacts, "test-app")
+    assert await reloaded.get_queue_size() == 4
+
+
+@run_async
+async def test_unreadable_journal_keeps_the_snapshot(artifacts):
+    """A journal that fails to load neither discards the snapshot nor gets overwritten."""
+    seeded = PriorityQueueService(artifacts, "test-app")
+    for i in range(3):
+        await _add_victim(seeded, i)
+    assert await seeded.save_queue()
+    await _add_victim(seeded, 3)  # Journaled only
+    await seeded.remove_victim("V-00000000")  # Journaled only
+    assert await seeded.flush()
+    stored = dict(artifacts.artifacts)
+
+    failing = {seeded.journal_filename}
+    _failing_load(artifacts, failing)
+    service = PriorityQueueService(artifacts, "test-app")
+    assert await service.get_queue_size() == 3  # Snapshot alone
+    await service.update_victim_status("V-00000001", "resolved")
+    await _add_victim(service, 4)
+
+    # Nothing may be written while the stored journal is unread
+    del artifacts.writes[:]
+    assert service.degraded
+    assert not await service.save_queue()
+    assert not await service.flush()
+    assert artifacts.writes == [] and artifacts.artifacts == stored
+
+    # Once it can be read it is merged under the newer changes
+    failing.clear()
+    assert await service.flush()
+    reloaded = PriorityQueueService(artifacts, "test-app")
+    victims = await _victims(reloaded)
+    assert {entry["victim_id"] for entry in victims} == {"V-00000001", "V-00000002", "V-00000003", "V-00000004"}
+    assert (await reloaded.get_victim_by_id("V-00000001"))["status"] == "resolved"
+
+
+def test_flush_after_the_flusher_loop_closed(artifacts):
+    """Shutdown can flush on a fresh loop after the loop that ran the flusher has closed."""
+    service = PriorityQueueService(artifacts, "test-app")
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(_add_victim(service, 0))  # Leaves the flusher pending on `loop`
+    loop.close()
+
+    assert asyncio.run(service.flush())
+
+    reloaded = PriorityQueueService(artifacts, "test-app")
+    assert asyncio.run(reloaded.get_queue_size()) == 1
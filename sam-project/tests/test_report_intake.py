@@ -0,0 +1,47 @@
+"""
+Tests for the report intake helpers shared by the Orchestrator and
+ResourceAgent tools.
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.report_intake import MISSING_FIELD_QUESTIONS, freeze, thaw
+from src.main_orchestrator import tools as orchestrator_tools
+from src.resource_agent import tools as resource_tools
+
+
+def test_frozen_template_cannot_change_and_thawed_copies_are_independent():
+    """Frozen templates reject writes; every thawed copy is its own plain dict."""
+    template = freeze({"priority": "HIGH", "items": ["first_aid_kit", "bandages"]})
+    with pytest.raises(TypeError):
+        template["priority"] = "LOW"
+    assert template["items"] == ("first_aid_kit", "bandages")
+
+    first, second = thaw(template), thaw(template)
+    first["items"].append("splint")
+    assert second == {"priority": "HIGH", "items": ["first_aid_kit", "bandages"]}
+    assert type(second) is dict and type(second["items"]) is list
+
+
+@pytest.mark.parametrize("tools", [orchestrator_tools, resource_tools])
+def test_validate_victim_report_lists_every_missing_field(tools):
+    """Incomplete reports list all missing fields and ask about the first."""
+    result = asyncio.run(tools.validate_victim_report(location="  ", num_people=0))
+    assert result["is_valid"] is False
+    assert result["missing_fields"] == ["location", "description", "num_people"]
+    assert result["next_question"] == MISSING_FIELD_QUESTIONS["location"]
+
+    result = asyncio.run(tools.validate_victim_report(latitude=13.7, longitude=100.5, description="Trapped"))
+    assert result["missing_fields"] == ["num_people"]
+    assert result["next_question"] == MISSING_FIELD_QUESTIONS["num_people"]
+
+    result = asyncio.run(tools.validate_victim_report(location="Main St", description="Trapped", num_people=2))
+    assert result["is_valid"] is True
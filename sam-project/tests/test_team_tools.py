@@ -0,0 +1,102 @@
+"""
+Tests for the RescueAgent team tools: the status index behind team
+lookups and the equipment filter used to pick the nearest team.
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.rescue_agent import team_tools
+
+
+@pytest.fixture(autouse=True)
+def reset_teams():
+    """Every test starts and ends with all teams available."""
+    team_tools._reset_teams()
+    yield
+    team_tools._reset_teams()
+
+
+def _team_ids(teams):
+    return [team["team_id"] for team in teams]
+
+
+def _set_status(team_id, status):
+    result = asyncio.run(team_tools.update_team_status(team_id, status))
+    assert result["status"] == "success", result
+
+
+def test_status_filter_follows_status_changes_in_roster_order():
+    """Filtered teams track status changes and keep the roster order, not the order they changed in."""
+    _set_status("T-Charlie", "en_route")
+    _set_status("T-Alpha", "en_route")
+
+    en_route = asyncio.run(team_tools.get_all_teams(status_filter="en_route"))
+    assert _team_ids(en_route["teams"]) == ["T-Alpha", "T-Charlie"]
+    assert en_route["summary"] == {"available": 2, "en_route": 2, "on_scene": 0}
+    assert en_route["deployed"] == 2
+
+    available = asyncio.run(team_tools.get_all_teams(status_filter="available"))
+    assert _team_ids(available["teams"]) == ["T-Bravo", "T-Delta"]
+
+    # Back to available: still listed in roster order, not appended last
+    _set_status("T-Alpha", "available")
+    available = asyncio.run(team_tools.get_all_teams(status_filter="available"))
+    assert _team_ids(available["teams"]) == ["T-Alpha", "T-Bravo", "T-Delta"]
+    en_route = asyncio.run(team_tools.get_all_teams(status_filter="en_route"))
+    assert _team_ids(en_route["teams"]) == ["T-Charlie"]
+
+    unfiltered = asyncio.run(team_tools.get_all_teams())
+    assert _team_ids(unfiltered["teams"]) == ["T-Alpha", "T-Bravo", "T-Charlie", "T-Delta"]
+
+
+def _nearest(required_equipment, location=None):
+    return asyncio.run(team_tools.get_nearest_available_team(
+        location or {"lat": 13.74, "lng": 100.52}, required_equipment=required_equipment
+    ))
+
+
+def _candidates(result):
+    return {result["nearest_team"]["team_id"]} | {alt["team"]["team_id"] for alt in result["alternatives"]}
+
+
+def test_equipment_filter_requires_every_item():
+    """Only teams carrying all of the required equipment are considered."""
+    # Alpha and Bravo both carry a stretcher and a first aid kit
+    result = _nearest(["stretcher", "first_aid_kit"])
+    assert result["status"] == "success"
+    assert _candidates(result) == {"T-Alpha", "T-Bravo"}
+
+    # A single item carried by one team only
+    result = _nearest(["hose"])
+    assert _candidates(result) == {"T-Delta"}
+
+    # Bravo has the defibrillator and Charlie the boat, but nobody has both
+    result = _nearest(["defibrillator", "rescue_boat"])
+    assert result["status"] == "error"
+
+    # Without a filter every available team is a candidate (nearest three reported)
+    result = _nearest(None)
+    assert len(_candidates(result)) == 3
+
+
+def test_equipment_filter_rejects_unknown_equipment():
+    """Equipment no team carries matches nobody, alone or alongside known items."""
+    assert _nearest(["jetpack"])["status"] == "error"
+    assert _nearest(["stretcher", "jetpack"])["status"] == "error"
+
+
+def test_equipment_filter_skips_unavailable_teams():
+    """A team with the right equipment is ignored while it is deployed."""
+    _set_status("T-Delta", "en_route")
+    assert _nearest(["hose"])["status"] == "error"
+
+    _set_status("T-Alpha", "on_scene")
+    assert _candidates(_nearest(["stretcher"])) == {"T-Bravo"}